@@ -1,7 +1,11 @@
 """Dependency injection setup for FastAPI."""
 
+import os
+from functools import lru_cache
+
 import boto3
-from fastapi import Depends
+from botocore.config import Config as BotocoreConfig
+from fastapi import FastAPI, Request
 
 from backend.config import Config
 from backend.repositories.event_repository import EventRepository
@@ -11,102 +15,141 @@ from backend.services.event_service import EventService
 from backend.services.user_service import UserService
 from backend.services.registration_service import RegistrationService
 
+# Shared boto3 session and client configuration. TCP keep-alive prevents the
+# TLS handshake from being re-run between invocations on warm Lambda
+# containers, and the enlarged pool lets concurrent requests reuse sockets.
+# The timeouts cut off stalled connections early so the adaptive retry can
+# issue a fresh request instead of riding out botocore's 60s defaults; they
+# are generous enough to cover TransactWriteItems and full-page scans.
+_BOTO_CONFIG = BotocoreConfig(
+    tcp_keepalive=True,
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    connect_timeout=2,
+    read_timeout=5
+)
+
+_session = boto3.session.Session()
+
+
+@lru_cache(maxsize=1)
+def _get_dynamodb_resource():
+    """Get the process-wide DynamoDB resource, creating it on first use."""
+    return _session.resource('dynamodb', config=_BOTO_CONFIG)
 
+
+@lru_cache(maxsize=8)
+def _get_table(table_name: str):
+    """Get a cached DynamoDB Table handle for the given table name."""
+    return _get_dynamodb_resource().Table(table_name)
+
+
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get application configuration.
-    
+
     Returns:
         Config instance loaded from environment
     """
     return Config.from_env()
 
 
-def get_dynamodb_table(config: Config = Depends(get_config)):
+def get_dynamodb_table(config: Config = None):
     """Get DynamoDB table instance.
-    
+
     Args:
-        config: Application configuration
-        
+        config: Application configuration (defaults to the cached config)
+
     Returns:
         boto3 DynamoDB Table resource
     """
-    dynamodb = boto3.resource('dynamodb')
-    return dynamodb.Table(config.table_name)
+    if config is None:
+        config = get_config()
+    return _get_table(config.table_name)
 
 
-def get_event_repository(table=Depends(get_dynamodb_table)) -> EventRepository:
-    """Get event repository instance.
-    
-    Args:
-        table: DynamoDB table
-        
-    Returns:
-        EventRepository instance
-    """
-    return EventRepository(table)
-
+@lru_cache(maxsize=1)
+def _build_services() -> dict:
+    """Construct the repository and service singletons.
 
-def get_user_repository(table=Depends(get_dynamodb_table)) -> UserRepository:
-    """Get user repository instance.
-    
-    Args:
-        table: DynamoDB table
-        
-    Returns:
-        UserRepository instance
+    Built once per process; the lifespan handler attaches the result to
+    app.state, and the request-scoped getters fall back to it when no
+    lifespan has run (e.g. bare TestClient usage).
     """
-    return UserRepository(table)
+    table = get_dynamodb_table()
+    event_repo = EventRepository(table)
+    user_repo = UserRepository(table)
+    registration_repo = RegistrationRepository(table)
+    return {
+        'event_service': EventService(event_repo),
+        'user_service': UserService(user_repo),
+        'registration_service': RegistrationService(
+            registration_repo, event_repo, user_repo
+        ),
+    }
 
 
-def get_registration_repository(table=Depends(get_dynamodb_table)) -> RegistrationRepository:
-    """Get registration repository instance.
-    
-    Args:
-        table: DynamoDB table
-        
-    Returns:
-        RegistrationRepository instance
-    """
-    return RegistrationRepository(table)
+def init_app_state(app: FastAPI) -> None:
+    """Attach the shared services to app.state at startup."""
+    for name, service in _build_services().items():
+        setattr(app.state, name, service)
+
 
+def get_event_service(request: Request) -> EventService:
+    """Get the shared event service instance.
 
-def get_event_service(repo: EventRepository = Depends(get_event_repository)) -> EventService:
-    """Get event service instance.
-    
     Args:
-        repo: EventRepository instance
-        
+        request: Current request
+
     Returns:
         EventService instance
     """
-    return EventService(repo)
+    service = getattr(request.app.state, 'event_service', None)
+    return service if service is not None else _build_services()['event_service']
+
 
+def get_user_service(request: Request) -> UserService:
+    """Get the shared user service instance.
 
-def get_user_service(repo: UserRepository = Depends(get_user_repository)) -> UserService:
-    """Get user service instance.
-    
     Args:
-        repo: UserRepository instance
-        
+        request: Current request
+
     Returns:
         UserService instance
     """
-    return UserService(repo)
+    service = getattr(request.app.state, 'user_service', None)
+    return service if service is not None else _build_services()['user_service']
+
 
+def get_registration_service(request: Request) -> RegistrationService:
+    """Get the shared registration service instance.
 
-def get_registration_service(
-    reg_repo: RegistrationRepository = Depends(get_registration_repository),
-    event_repo: EventRepository = Depends(get_event_repository),
-    user_repo: UserRepository = Depends(get_user_repository)
-) -> RegistrationService:
-    """Get registration service instance.
-    
     Args:
-        reg_repo: RegistrationRepository instance
-        event_repo: EventRepository instance
-        user_repo: UserRepository instance
-        
+        request: Current request
+
     Returns:
         RegistrationService instance
     """
-    return RegistrationService(reg_repo, event_repo, user_repo)
+    service = getattr(request.app.state, 'registration_service', None)
+    return service if service is not None else _build_services()['registration_service']
+
+
+def _warm_connection() -> None:
+    """Open the DynamoDB connection during container init.
+
+    Issuing one trivial call at module import moves the TLS handshake and
+    credential resolution off the first request's critical path.
+    DescribeEndpoints is the cheapest such call: it carries no table data
+    and needs no table-level permissions, unlike the DescribeTable used
+    previously. Only runs on Lambda; failures are ignored since this is
+    purely a warmup.
+    """
+    if not os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+        return
+    try:
+        _get_dynamodb_resource().meta.client.describe_endpoints()
+    except Exception:
+        pass
+
+
+_warm_connection()
@@ -24,3 +24,13 @@ class CapacityExceededError(DomainException):
 class RepositoryError(DomainException):
     """Raised when database operations fail."""
     pass
+
+
+class ThrottledError(DomainException):
+    """Raised when the database throttles a request even after retries."""
+    pass
+
+
+class StaleWriteError(DomainException):
+    """Raised when an optimistically-versioned write loses its race."""
+    pass
@@ -1,31 +1,97 @@
 """FastAPI application entry point."""
 
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from mangum import Mangum
 
+from backend.dependencies import init_app_state
+from backend.exceptions import (
+    CapacityExceededError,
+    DomainException,
+    RepositoryError,
+    ResourceAlreadyExistsError,
+    ResourceNotFoundError,
+    StaleWriteError,
+    ThrottledError
+)
 from backend.routes import events, users, registrations
 
 
-app = FastAPI(title="Events API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build shared repositories and services once at startup."""
+    init_app_state(app)
+    yield
+
 
-# CORS middleware
+app = FastAPI(
+    title="Events API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# CORS middleware. max_age lets browsers cache preflight responses for a
+# day instead of re-issuing an OPTIONS round trip per cross-origin call;
+# origins can be narrowed per environment via CORS_ALLOW_ORIGINS.
+_allow_origins = os.environ.get('CORS_ALLOW_ORIGINS', '*').split(',')
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=_allow_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Token"],
+    max_age=86400,
 )
 
-# Root endpoints
+@app.exception_handler(ThrottledError)
+async def throttled_handler(request, exc: ThrottledError):
+    """Answer throttled requests with 503 so clients back off and retry."""
+    return ORJSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
+# Status codes for the remaining domain exceptions. One app-level handler
+# replaces the identical try/except blocks every route used to carry, so
+# handlers stay a straight-line happy path. Starlette walks the exception's
+# MRO when picking a handler, so ThrottledError keeps its dedicated one.
+_DOMAIN_STATUS = {
+    ResourceNotFoundError: 404,
+    ResourceAlreadyExistsError: 409,
+    CapacityExceededError: 409,
+    StaleWriteError: 409,
+    RepositoryError: 500,
+}
+
+
+@app.exception_handler(DomainException)
+async def domain_exception_handler(request, exc: DomainException):
+    """Map domain exceptions to their HTTP status codes."""
+    return ORJSONResponse(
+        status_code=_DOMAIN_STATUS.get(type(exc), 500),
+        content={"detail": str(exc)},
+    )
+
+
+# Root endpoints. These do no I/O, so running them as coroutines avoids
+# the threadpool dispatch sync routes pay. The DynamoDB-backed routes stay
+# sync on purpose: under Mangum each Lambda invocation serves one request,
+# so blocking boto3 calls never contend for an event loop here.
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Events API is running", "version": "1.0.0"}
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "healthy"}
 
 
@@ -1,27 +1,23 @@
 """API models for HTTP request and response structures."""
 
-from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+import datetime
+from operator import attrgetter
+from typing import Literal, Optional, TypedDict
+from pydantic import BaseModel, Field
+
+from backend.models.domain import DomainEvent, DomainRegistration
+
+EventStatus = Literal['scheduled', 'ongoing', 'completed', 'cancelled', 'active']
 
 
 class EventBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
     description: str = Field(..., min_length=1, max_length=2000)
-    date: str = Field(..., description="Event date in ISO format (YYYY-MM-DD)")
+    date: datetime.date = Field(..., description="Event date in ISO format (YYYY-MM-DD)")
     location: str = Field(..., min_length=1, max_length=300)
     capacity: int = Field(..., gt=0, le=100000)
     organizer: str = Field(..., min_length=1, max_length=200)
-    status: str = Field(..., pattern="^(scheduled|ongoing|completed|cancelled|active)$")
-    
-    @field_validator('date')
-    @classmethod
-    def validate_date(cls, v):
-        try:
-            datetime.fromisoformat(v)
-            return v
-        except ValueError:
-            raise ValueError('Date must be in ISO format (YYYY-MM-DD)')
+    status: EventStatus
 
 
 class EventCreate(EventBase):
@@ -32,23 +28,12 @@ class EventCreate(EventBase):
 class EventUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = Field(None, min_length=1, max_length=2000)
-    date: Optional[str] = None
+    date: Optional[datetime.date] = None
     location: Optional[str] = Field(None, min_length=1, max_length=300)
     capacity: Optional[int] = Field(None, gt=0, le=100000)
     organizer: Optional[str] = Field(None, min_length=1, max_length=200)
-    status: Optional[str] = Field(None, pattern="^(scheduled|ongoing|completed|cancelled|active)$")
+    status: Optional[EventStatus] = None
     waitlistEnabled: Optional[bool] = None
-    
-    @field_validator('date')
-    @classmethod
-    def validate_date(cls, v):
-        if v is not None:
-            try:
-                datetime.fromisoformat(v)
-                return v
-            except ValueError:
-                raise ValueError('Date must be in ISO format (YYYY-MM-DD)')
-        return v
 
 
 class Event(EventBase):
@@ -59,6 +44,77 @@ class Event(EventBase):
     waitlistEnabled: bool = False
 
 
+class EventDict(TypedDict, total=False):
+    """Plain-dict shape of an event item as read from the database.
+
+    Used on the hot list path, where items already validated on write are
+    serialized directly instead of being re-validated through `Event`.
+    """
+    eventId: str
+    title: str
+    description: str
+    date: str
+    location: str
+    capacity: int
+    organizer: str
+    status: str
+    currentRegistrations: int
+    waitlistEnabled: bool
+    createdAt: str
+    updatedAt: str
+
+
+# Domain -> API mappers, shared by every route that returns these shapes.
+# attrgetter fetches all fields in one C-level call, and model_construct
+# skips re-validation of data that was validated when it was written —
+# together they replace a dozen per-item getattr/kwarg ops with three.
+_event_fields = attrgetter(
+    'event_id', 'title', 'description', 'date', 'location', 'capacity',
+    'organizer', 'status', 'current_registrations', 'waitlist_enabled',
+    'created_at', 'updated_at'
+)
+_registration_fields = attrgetter(
+    'user_id', 'event_id', 'registration_status', 'registered_at'
+)
+
+
+def event_to_api(e: DomainEvent) -> 'Event':
+    """Convert a DomainEvent to the API Event model without re-validation.
+
+    model_construct performs no coercion, so every value must already
+    match its declared field type; date is the one field stored in a
+    different shape (ISO string) and is converted here.
+    """
+    (event_id, title, description, date, location, capacity, organizer,
+     event_status, current_registrations, waitlist_enabled, created_at,
+     updated_at) = _event_fields(e)
+    return Event.model_construct(
+        eventId=event_id,
+        title=title,
+        description=description,
+        date=datetime.date.fromisoformat(date),
+        location=location,
+        capacity=capacity,
+        organizer=organizer,
+        status=event_status,
+        currentRegistrations=current_registrations,
+        waitlistEnabled=waitlist_enabled,
+        createdAt=created_at,
+        updatedAt=updated_at
+    )
+
+
+def registration_to_api(r: DomainRegistration) -> 'Registration':
+    """Convert a DomainRegistration to the API model without re-validation."""
+    user_id, event_id, registration_status, registered_at = _registration_fields(r)
+    return Registration.model_construct(
+        userId=user_id,
+        eventId=event_id,
+        registrationStatus=registration_status,
+        registeredAt=registered_at
+    )
+
+
 class User(BaseModel):
     userId: str = Field(..., min_length=1, max_length=100)
     name: str = Field(..., min_length=1, max_length=200)
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainEvent:
     """Internal representation of an event."""
     event_id: str
@@ -21,7 +21,7 @@ class DomainEvent:
     updated_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainUser:
     """Internal representation of a user."""
     user_id: str
@@ -29,10 +29,16 @@ class DomainUser:
     created_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainRegistration:
-    """Internal representation of a registration."""
+    """Internal representation of a registration.
+
+    version supports optimistic concurrency control on status mutations;
+    it starts at 1 and increments on every conditional update. Rows
+    written before versioning default to 1.
+    """
     user_id: str
     event_id: str
     registration_status: str
     registered_at: str
+    version: int = 1
@@ -1,13 +1,92 @@
 """Base repository class."""
 
+from typing import Any, Dict, NoReturn
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+from backend.exceptions import RepositoryError, ThrottledError
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+# Error codes that indicate throttling rather than a hard failure. botocore's
+# adaptive retry mode has already retried these in-process by the time they
+# surface here.
+_THROTTLING_CODES = {
+    'ProvisionedThroughputExceededException',
+    'ThrottlingException',
+    'RequestLimitExceeded'
+}
+
+
+def raise_repository_error(action: str, error: ClientError) -> NoReturn:
+    """Translate a ClientError that survived botocore's retries.
+
+    Throttling gets its own exception type so the HTTP layer can answer
+    503 with Retry-After instead of a generic 500.
+
+    Args:
+        action: Short description of the failed operation
+        error: The underlying ClientError
+
+    Raises:
+        ThrottledError: If the error is a throttling response
+        RepositoryError: For any other database failure
+    """
+    code = error.response.get('Error', {}).get('Code')
+    if code in _THROTTLING_CODES:
+        raise ThrottledError(f"Failed to {action}: throttled by DynamoDB")
+    raise RepositoryError(f"Failed to {action}: {str(error)}")
+
+
+def serialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a plain Python item into the low-level DynamoDB attribute format.
+
+    Needed for client-level operations (e.g. TransactWriteItems) that do
+    not go through the resource layer's automatic marshalling.
+    """
+    return {k: _serializer.serialize(v) for k, v in item.items()}
+
+
+def deserialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a low-level DynamoDB attribute-format item into plain Python.
+
+    Counterpart of serialize_item for client-level reads (e.g.
+    BatchGetItem) that bypass the resource layer's unmarshalling.
+    """
+    return {k: _deserializer.deserialize(v) for k, v in item.items()}
+
+
+def event_metadata_key(event_id: str) -> Dict[str, str]:
+    """Primary key of an event's metadata item."""
+    return {'PK': 'EVENT#' + event_id, 'SK': 'METADATA'}
+
+
+def user_profile_key(user_id: str) -> Dict[str, str]:
+    """Primary key of a user's profile item."""
+    return {'PK': 'USER#' + user_id, 'SK': 'PROFILE'}
+
+
+def user_event_key(user_id: str, event_id: str) -> Dict[str, str]:
+    """Primary key of the user -> event registration lookup item."""
+    return {'PK': 'USER#' + user_id, 'SK': 'EVENT#' + event_id}
+
+
+def event_registration_key(event_id: str, user_id: str) -> Dict[str, str]:
+    """Primary key of the event -> user registration lookup item."""
+    return {'PK': 'EVENT#' + event_id, 'SK': 'REGISTRATION#' + user_id}
+
 
 class BaseRepository:
     """Base class for all repositories."""
-    
+
     def __init__(self, table):
         """Initialize repository with DynamoDB table.
-        
+
         Args:
             table: boto3 DynamoDB Table resource
         """
         self.table = table
+        self.client = table.meta.client
+        self.table_name = table.name
@@ -1,12 +1,163 @@
 """Event repository for data access operations."""
 
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from functools import lru_cache, partial
+from operator import itemgetter
 from typing import Optional, List, Dict, Any
+
+import orjson
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.conditions import Attr, Key
+from cachetools import TTLCache
 
-from backend.repositories.base import BaseRepository
+from backend.repositories.base import (
+    BaseRepository,
+    deserialize_item,
+    event_metadata_key,
+    raise_repository_error
+)
 from backend.models.domain import DomainEvent
-from backend.exceptions import ResourceNotFoundError, RepositoryError
+from backend.exceptions import CapacityExceededError, ResourceNotFoundError
+
+# Optional GSI with PK=status, so status-filtered listings are a Query over
+# matching items instead of a full-table Scan. Enable by setting the env var
+# once the index exists; otherwise filtered listings fall back to a Scan
+# with a server-side status filter.
+STATUS_INDEX_NAME = os.environ.get('EVENTS_STATUS_INDEX_NAME')
+
+# Optional GSI with PK=entityType for unfiltered listings. Every event item
+# written since the attribute was introduced carries entityType='EVENT';
+# enable the index (after backfilling older items) by setting the env var,
+# otherwise the unfiltered path falls back to a Scan.
+TYPE_INDEX_NAME = os.environ.get('EVENTS_TYPE_INDEX_NAME')
+
+# Segment count for the Scan fallback. Parallel segments split the table
+# partition-wise, so wall-clock scan time drops near-linearly at the same
+# RCU cost. The boto3 connection pool (64) comfortably covers the default.
+SCAN_SEGMENTS = int(os.environ.get('EVENTS_SCAN_SEGMENTS', '4'))
+
+# Process-local cache for hot event reads, shared by every path that goes
+# through get_by_id (including registration). Lambda containers keep module
+# globals across invocations, so repeat reads of a popular event skip the
+# GetItem round trip. The TTL is short because registrations consult this
+# copy for waitlist branching; capacity itself stays authoritative via the
+# conditional transaction. Every write path invalidates its entry.
+_EVENT_CACHE_TTL = int(os.environ.get('EVENT_CACHE_TTL_SECONDS', '5'))
+_event_cache: TTLCache = TTLCache(maxsize=1024, ttl=_EVENT_CACHE_TTL)
+_event_cache_lock = threading.Lock()
+
+
+# Pre-serialized list payloads, keyed by status filter. A hit turns the
+# unpaged list endpoint into a dict lookup plus send-bytes — no query, no
+# per-item work, no serialization. Any event write clears all entries, so
+# the TTL only bounds staleness across containers.
+_LIST_CACHE_TTL = int(os.environ.get('EVENT_LIST_CACHE_TTL_SECONDS', '5'))
+_list_cache: TTLCache = TTLCache(maxsize=16, ttl=_LIST_CACHE_TTL)
+_list_cache_lock = threading.Lock()
+
+
+def invalidate_event_caches(event_id: str) -> None:
+    """Drop an event's cached reads after any write that touches it.
+
+    Clears the per-event entry and every cached list payload in one
+    call. Shared entry point for all event-mutating paths, including
+    the registration transactions in the registration repository that
+    move the event's counter.
+    """
+    with _event_cache_lock:
+        _event_cache.pop(event_id, None)
+    # Any single-event write also stales every cached list payload.
+    with _list_cache_lock:
+        _list_cache.clear()
+
+
+# Update-expression fragments for the updatable event fields, built once at
+# import. Every attribute name goes through a #-alias, so reserved keywords
+# (date, location, capacity, status) need no per-call special-casing.
+_UPDATE_FIELDS = (
+    'title', 'description', 'date', 'location', 'capacity',
+    'organizer', 'status', 'waitlistEnabled', 'updatedAt'
+)
+_FIELD_EXPR = {f: (f"#{f} = :{f}", f"#{f}", f":{f}") for f in _UPDATE_FIELDS}
+
+
+@lru_cache(maxsize=64)
+def _compile_update(fields: tuple) -> tuple:
+    """Compile the UpdateExpression and name aliases for a field set.
+
+    Field combinations come from EventUpdate, so there are few distinct
+    sets in practice and each is compiled once per process.
+
+    Args:
+        fields: Sorted tuple of attribute names being updated
+
+    Returns:
+        Tuple of (UpdateExpression string, ExpressionAttributeNames dict)
+    """
+    parts = []
+    names = {}
+    for f in fields:
+        part, name, _ = _FIELD_EXPR.get(f) or (f"#{f} = :{f}", f"#{f}", f":{f}")
+        parts.append(part)
+        names[name] = f
+    return "SET " + ", ".join(parts), names
+
+
+# Projection covering exactly the attributes the domain model consumes.
+# Keeps PK/SK and any future bookkeeping attributes off the wire; aliases
+# sidestep reserved keywords.
+_EVENT_ATTRS = (
+    'eventId', 'title', 'description', 'date', 'location', 'capacity',
+    'organizer', 'status', 'currentRegistrations', 'waitlistEnabled',
+    'createdAt', 'updatedAt'
+)
+_EVENT_PROJECTION = ', '.join(f'#{a}' for a in _EVENT_ATTRS)
+_EVENT_PROJECTION_NAMES = {f'#{a}': a for a in _EVENT_ATTRS}
+
+
+# One C-level multi-get for the required attributes instead of ten hashed
+# lookups per row.
+_get_required = itemgetter(
+    'eventId', 'title', 'description', 'date', 'location', 'capacity',
+    'organizer', 'status', 'createdAt', 'updatedAt'
+)
+
+
+def _item_to_domain(item: Dict[str, Any]) -> DomainEvent:
+    """Build a DomainEvent from a DynamoDB item.
+
+    The counters come back from boto3's resource layer as Decimal; they
+    are converted here so every copy of the domain object — cached,
+    mapped or streamed — carries the real ints the model declares.
+    """
+    (event_id, title, description, date, location, capacity,
+     organizer, status, created_at, updated_at) = _get_required(item)
+    return DomainEvent(
+        event_id=event_id,
+        title=title,
+        description=description,
+        date=date,
+        location=location,
+        capacity=int(capacity),
+        organizer=organizer,
+        status=status,
+        current_registrations=int(item.get('currentRegistrations', 0)),
+        waitlist_enabled=item.get('waitlistEnabled', False),
+        created_at=created_at,
+        updated_at=updated_at
+    )
+
+
+def _plain_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace boto3's Decimal numbers with native int/float in an item."""
+    return {
+        k: (int(v) if v % 1 == 0 else float(v)) if isinstance(v, Decimal) else v
+        for k, v in item.items()
+    }
 
 
 class EventRepository(BaseRepository):
@@ -29,6 +180,7 @@ class EventRepository(BaseRepository):
                 Item={
                     'PK': f'EVENT#{event.event_id}',
                     'SK': 'METADATA',
+                    'entityType': 'EVENT',
                     'eventId': event.event_id,
                     'title': event.title,
                     'description': event.description,
@@ -43,9 +195,10 @@ class EventRepository(BaseRepository):
                     'updatedAt': event.updated_at
                 }
             )
+            invalidate_event_caches(event.event_id)
             return event
         except ClientError as e:
-            raise RepositoryError(f"Failed to create event: {str(e)}")
+            raise_repository_error("create event", e)
     
     def get_by_id(self, event_id: str) -> Optional[DomainEvent]:
         """Get event by ID.
@@ -59,93 +212,353 @@ class EventRepository(BaseRepository):
         Raises:
             RepositoryError: If database operation fails
         """
+        with _event_cache_lock:
+            cached = _event_cache.get(event_id)
+        if cached is not None:
+            return cached
+
         try:
             response = self.table.get_item(
-                Key={
-                    'PK': f'EVENT#{event_id}',
-                    'SK': 'METADATA'
-                }
+                Key=event_metadata_key(event_id),
+                ProjectionExpression=_EVENT_PROJECTION,
+                ExpressionAttributeNames=_EVENT_PROJECTION_NAMES
             )
-            
+
             if 'Item' not in response:
                 return None
-            
+
             item = response['Item']
-            return DomainEvent(
-                event_id=item['eventId'],
-                title=item['title'],
-                description=item['description'],
-                date=item['date'],
-                location=item['location'],
-                capacity=item['capacity'],
-                organizer=item['organizer'],
-                status=item['status'],
-                current_registrations=item.get('currentRegistrations', 0),
-                waitlist_enabled=item.get('waitlistEnabled', False),
-                created_at=item['createdAt'],
-                updated_at=item['updatedAt']
-            )
+            event = _item_to_domain(item)
         except ClientError as e:
-            raise RepositoryError(f"Failed to get event: {str(e)}")
-    
+            raise_repository_error("get event", e)
+
+        with _event_cache_lock:
+            _event_cache[event_id] = event
+        return event
+
+    def get_cached(self, event_id: str) -> Optional[DomainEvent]:
+        """Peek this process's cached copy of an event, with no I/O.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            The DomainEvent if a live entry exists in this container's
+            cache, None otherwise (no fetch is attempted)
+        """
+        with _event_cache_lock:
+            return _event_cache.get(event_id)
+
+    def get_by_ids(self, event_ids: List[str]) -> List[DomainEvent]:
+        """Get multiple events by ID in batched reads.
+
+        Uses BatchGetItem (up to 100 keys per request, fetched in parallel
+        server-side) instead of one GetItem round trip per event. Unprocessed
+        keys are retried with a short backoff. Missing events are omitted;
+        the result preserves the order of event_ids.
+
+        Args:
+            event_ids: Event IDs to fetch
+
+        Returns:
+            List of DomainEvent objects in input order
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        found: Dict[str, DomainEvent] = {}
+        try:
+            for start in range(0, len(event_ids), 100):
+                request = {
+                    self.table_name: {
+                        'Keys': [
+                            {
+                                'PK': {'S': f'EVENT#{eid}'},
+                                'SK': {'S': 'METADATA'}
+                            }
+                            for eid in event_ids[start:start + 100]
+                        ],
+                        'ProjectionExpression': _EVENT_PROJECTION,
+                        'ExpressionAttributeNames': _EVENT_PROJECTION_NAMES
+                    }
+                }
+                backoff = 0.05
+                while request:
+                    response = self.client.batch_get_item(RequestItems=request)
+                    for raw in response.get('Responses', {}).get(self.table_name, []):
+                        item = deserialize_item(raw)
+                        found[item['eventId']] = _item_to_domain(item)
+                    # Throttled keys come back unprocessed; retry them with
+                    # exponential backoff until the batch drains.
+                    request = response.get('UnprocessedKeys') or None
+                    if request:
+                        time.sleep(backoff)
+                        backoff = min(backoff * 2, 1.0)
+            return [found[eid] for eid in event_ids if eid in found]
+        except ClientError as e:
+            raise_repository_error("batch get events", e)
+
+    def _fetch_all_items(self, status_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch all event items, following pagination.
+
+        Args:
+            status_filter: Optional status to filter by
+
+        Returns:
+            List of raw DynamoDB items
+        """
+        if status_filter and STATUS_INDEX_NAME:
+            # Query the status GSI so only matching items are read,
+            # instead of scanning (and paying for) the whole table.
+            query_kwargs = {
+                'IndexName': STATUS_INDEX_NAME,
+                'KeyConditionExpression': Key('status').eq(status_filter),
+                'ProjectionExpression': _EVENT_PROJECTION,
+                'ExpressionAttributeNames': _EVENT_PROJECTION_NAMES
+            }
+            response = self.table.query(**query_kwargs)
+            items = response.get('Items', [])
+
+            # Handle pagination
+            while 'LastEvaluatedKey' in response:
+                response = self.table.query(
+                    ExclusiveStartKey=response['LastEvaluatedKey'],
+                    **query_kwargs
+                )
+                items.extend(response.get('Items', []))
+        elif TYPE_INDEX_NAME:
+            # Query the entityType GSI: O(event_count) reads instead of an
+            # O(table_size) Scan over registrations and waitlist entries.
+            # Without the status GSI, a status filter runs server-side on
+            # top of this query.
+            query_kwargs = {
+                'IndexName': TYPE_INDEX_NAME,
+                'KeyConditionExpression': Key('entityType').eq('EVENT'),
+                'ProjectionExpression': _EVENT_PROJECTION,
+                'ExpressionAttributeNames': _EVENT_PROJECTION_NAMES
+            }
+            if status_filter:
+                query_kwargs['FilterExpression'] = Attr('status').eq(status_filter)
+            response = self.table.query(**query_kwargs)
+            items = response.get('Items', [])
+
+            # Handle pagination
+            while 'LastEvaluatedKey' in response:
+                response = self.table.query(
+                    ExclusiveStartKey=response['LastEvaluatedKey'],
+                    **query_kwargs
+                )
+                items.extend(response.get('Items', []))
+        elif SCAN_SEGMENTS > 1:
+            # Parallel Scan: each worker walks its own table segment, so
+            # the pages are fetched concurrently instead of one at a time.
+            items = []
+            with ThreadPoolExecutor(max_workers=SCAN_SEGMENTS) as pool:
+                for segment_items in pool.map(
+                    partial(self._scan_segment, status_filter=status_filter),
+                    range(SCAN_SEGMENTS)
+                ):
+                    items.extend(segment_items)
+        else:
+            items = self._scan_segment(
+                0, total_segments=1, status_filter=status_filter
+            )
+        return items
+
+    def _scan_segment(
+        self,
+        segment: int,
+        total_segments: int = SCAN_SEGMENTS,
+        status_filter: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Scan one table segment for event metadata items, following pagination.
+
+        Args:
+            segment: Segment index to scan
+            total_segments: Total number of parallel segments
+            status_filter: Optional status to filter by server-side
+
+        Returns:
+            List of raw DynamoDB items from this segment
+        """
+        filter_expr = Attr('SK').eq('METADATA')
+        if status_filter:
+            filter_expr = filter_expr & Attr('status').eq(status_filter)
+        scan_kwargs = {
+            'FilterExpression': filter_expr,
+            'ProjectionExpression': _EVENT_PROJECTION,
+            'ExpressionAttributeNames': _EVENT_PROJECTION_NAMES
+        }
+        if total_segments > 1:
+            scan_kwargs['Segment'] = segment
+            scan_kwargs['TotalSegments'] = total_segments
+
+        response = self.table.scan(**scan_kwargs)
+        items = response.get('Items', [])
+
+        # Handle pagination
+        while 'LastEvaluatedKey' in response:
+            response = self.table.scan(
+                ExclusiveStartKey=response['LastEvaluatedKey'],
+                **scan_kwargs
+            )
+            items.extend(response.get('Items', []))
+        return items
+
     def list_all(self, status_filter: Optional[str] = None) -> List[DomainEvent]:
         """List all events, optionally filtered by status.
-        
+
         Args:
             status_filter: Optional status to filter by
-            
+
         Returns:
             List of DomainEvent objects
-            
+
         Raises:
             RepositoryError: If database operation fails
         """
         try:
-            if status_filter:
-                response = self.table.scan(
-                    FilterExpression=Attr('SK').eq('METADATA') & Attr('status').eq(status_filter)
+            items = self._fetch_all_items(status_filter)
+            return [
+                _item_to_domain(item)
+                for item in items
+            ]
+        except ClientError as e:
+            raise_repository_error("list events", e)
+
+    def list_all_raw(self, status_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List all events as plain dicts, skipping domain-model construction.
+
+        The projection already matches the API response shape, so the list
+        endpoint can serialize these items directly instead of mapping each
+        one through DomainEvent and back. Decimals are converted to native
+        numbers so the result is JSON-serializable as-is.
+
+        Args:
+            status_filter: Optional status to filter by
+
+        Returns:
+            List of event items as plain dicts
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        try:
+            return [_plain_item(item) for item in self._fetch_all_items(status_filter)]
+        except ClientError as e:
+            raise_repository_error("list events", e)
+
+    def list_all_json(self, status_filter: Optional[str] = None) -> bytes:
+        """List all events as a pre-serialized JSON array.
+
+        Caches the orjson payload per status filter with a short TTL, so
+        repeat hits on the unpaged list endpoint within a warm container
+        skip the query and the serialization entirely. Every event write
+        clears the cache.
+
+        Args:
+            status_filter: Optional status to filter by
+
+        Returns:
+            JSON array of event objects, UTF-8 bytes
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        with _list_cache_lock:
+            cached = _list_cache.get(status_filter)
+        if cached is not None:
+            return cached
+
+        payload = orjson.dumps(self.list_all_raw(status_filter))
+        with _list_cache_lock:
+            _list_cache[status_filter] = payload
+        return payload
+
+    def list_page(
+        self,
+        status_filter: Optional[str] = None,
+        limit: int = 100,
+        start_key: Optional[Dict[str, Any]] = None
+    ) -> tuple:
+        """List a single page of events.
+
+        Args:
+            status_filter: Optional status to filter by
+            limit: Maximum number of items to return
+            start_key: ExclusiveStartKey from a previous page, if any
+
+        Returns:
+            Tuple of (list of DomainEvent objects, LastEvaluatedKey or None)
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        try:
+            kwargs: Dict[str, Any] = {
+                'Limit': limit,
+                'ProjectionExpression': _EVENT_PROJECTION,
+                'ExpressionAttributeNames': _EVENT_PROJECTION_NAMES
+            }
+            if start_key:
+                kwargs['ExclusiveStartKey'] = start_key
+
+            if status_filter and STATUS_INDEX_NAME:
+                response = self.table.query(
+                    IndexName=STATUS_INDEX_NAME,
+                    KeyConditionExpression=Key('status').eq(status_filter),
+                    **kwargs
                 )
-            else:
-                response = self.table.scan(
-                    FilterExpression=Attr('SK').eq('METADATA')
+            elif TYPE_INDEX_NAME:
+                if status_filter:
+                    kwargs['FilterExpression'] = Attr('status').eq(status_filter)
+                response = self.table.query(
+                    IndexName=TYPE_INDEX_NAME,
+                    KeyConditionExpression=Key('entityType').eq('EVENT'),
+                    **kwargs
                 )
-            
-            items = response.get('Items', [])
-            
-            # Handle pagination
-            while 'LastEvaluatedKey' in response:
+            else:
+                filter_expr = Attr('SK').eq('METADATA')
                 if status_filter:
-                    response = self.table.scan(
-                        ExclusiveStartKey=response['LastEvaluatedKey'],
-                        FilterExpression=Attr('SK').eq('METADATA') & Attr('status').eq(status_filter)
-                    )
-                else:
-                    response = self.table.scan(
-                        ExclusiveStartKey=response['LastEvaluatedKey'],
-                        FilterExpression=Attr('SK').eq('METADATA')
-                    )
-                items.extend(response.get('Items', []))
-            
-            return [
-                DomainEvent(
-                    event_id=item['eventId'],
-                    title=item['title'],
-                    description=item['description'],
-                    date=item['date'],
-                    location=item['location'],
-                    capacity=item['capacity'],
-                    organizer=item['organizer'],
-                    status=item['status'],
-                    current_registrations=item.get('currentRegistrations', 0),
-                    waitlist_enabled=item.get('waitlistEnabled', False),
-                    created_at=item['createdAt'],
-                    updated_at=item['updatedAt']
+                    filter_expr = filter_expr & Attr('status').eq(status_filter)
+                response = self.table.scan(
+                    FilterExpression=filter_expr,
+                    **kwargs
                 )
-                for item in items
+
+            events = [
+                _item_to_domain(item)
+                for item in response.get('Items', [])
             ]
+            return events, response.get('LastEvaluatedKey')
         except ClientError as e:
-            raise RepositoryError(f"Failed to list events: {str(e)}")
-    
+            raise_repository_error("list events", e)
+
+    def iter_all(self, status_filter: Optional[str] = None, page_size: int = 100):
+        """Iterate all events page by page without materializing the list.
+
+        Yields each page's events as it arrives, so peak memory stays at
+        one page regardless of table size and callers can start emitting
+        a streamed response before pagination finishes. Shares the
+        GSI/scan branching with list_page.
+
+        Args:
+            status_filter: Optional status to filter by
+            page_size: DynamoDB page size
+
+        Yields:
+            DomainEvent objects
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        start_key = None
+        while True:
+            events, start_key = self.list_page(status_filter, page_size, start_key)
+            yield from events
+            if not start_key:
+                return
+
     def update(self, event_id: str, updates: Dict[str, Any]) -> DomainEvent:
         """Update an event.
         
@@ -161,58 +574,30 @@ class EventRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            # Check if event exists
-            existing = self.get_by_id(event_id)
-            if not existing:
-                raise ResourceNotFoundError(f"Event with ID {event_id} not found")
-            
-            # Build update expression with reserved keyword handling
-            reserved_keywords = {'date', 'location', 'capacity', 'status', 'name'}
-            update_expression_parts = []
-            expression_attribute_names = {}
-            expression_attribute_values = {}
-            
-            for k, v in updates.items():
-                if k in reserved_keywords:
-                    update_expression_parts.append(f"#{k} = :{k}")
-                    expression_attribute_names[f"#{k}"] = k
-                else:
-                    update_expression_parts.append(f"#{k} = :{k}")
-                    expression_attribute_names[f"#{k}"] = k
-                expression_attribute_values[f":{k}"] = v
-            
-            update_expression = "SET " + ", ".join(update_expression_parts)
-            
+            # The expression and name aliases are memoized per field set;
+            # only the values dict is built per call.
+            update_expression, expression_attribute_names = _compile_update(
+                tuple(sorted(updates))
+            )
+            expression_attribute_values = {f':{k}': v for k, v in updates.items()}
+
+
             response = self.table.update_item(
-                Key={
-                    'PK': f'EVENT#{event_id}',
-                    'SK': 'METADATA'
-                },
+                Key=event_metadata_key(event_id),
                 UpdateExpression=update_expression,
+                ConditionExpression='attribute_exists(PK)',
                 ExpressionAttributeNames=expression_attribute_names,
                 ExpressionAttributeValues=expression_attribute_values,
                 ReturnValues="ALL_NEW"
             )
-            
+
+            invalidate_event_caches(event_id)
             item = response['Attributes']
-            return DomainEvent(
-                event_id=item['eventId'],
-                title=item['title'],
-                description=item['description'],
-                date=item['date'],
-                location=item['location'],
-                capacity=item['capacity'],
-                organizer=item['organizer'],
-                status=item['status'],
-                current_registrations=item.get('currentRegistrations', 0),
-                waitlist_enabled=item.get('waitlistEnabled', False),
-                created_at=item['createdAt'],
-                updated_at=item['updatedAt']
-            )
-        except ResourceNotFoundError:
-            raise
+            return _item_to_domain(item)
         except ClientError as e:
-            raise RepositoryError(f"Failed to update event: {str(e)}")
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise ResourceNotFoundError(f"Event with ID {event_id} not found")
+            raise_repository_error("update event", e)
     
     def delete(self, event_id: str) -> None:
         """Delete an event.
@@ -225,60 +610,85 @@ class EventRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
-            # Check if event exists
-            existing = self.get_by_id(event_id)
-            if not existing:
-                raise ResourceNotFoundError(f"Event with ID {event_id} not found")
-            
+            # Conditional delete: existence is checked by DynamoDB itself,
+            # so no separate read precedes the write.
             self.table.delete_item(
-                Key={
-                    'PK': f'EVENT#{event_id}',
-                    'SK': 'METADATA'
-                }
+                Key=event_metadata_key(event_id),
+                ConditionExpression='attribute_exists(PK)'
             )
-        except ResourceNotFoundError:
-            raise
+            invalidate_event_caches(event_id)
         except ClientError as e:
-            raise RepositoryError(f"Failed to delete event: {str(e)}")
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise ResourceNotFoundError(f"Event with ID {event_id} not found")
+            raise_repository_error("delete event", e)
     
-    def increment_registrations(self, event_id: str) -> None:
-        """Increment the registration count for an event.
-        
+    def increment_registrations(self, event_id: str) -> int:
+        """Atomically increment the registration count for an event.
+
+        Uses ADD with a capacity guard, the same expression the
+        registration transaction carries, so a standalone increment can
+        never push the counter past capacity or resurrect a deleted
+        event. DynamoDB evaluates the condition and the ADD atomically —
+        no read-modify-write, no lost updates under concurrency — and
+        returns the post-increment value, so callers that display the
+        new count need no follow-up read.
+
         Args:
             event_id: Event ID
-            
+
+        Returns:
+            The registration count after the increment
+
         Raises:
+            CapacityExceededError: If the event is missing or at capacity
             RepositoryError: If database operation fails
         """
         try:
-            self.table.update_item(
-                Key={
-                    'PK': f'EVENT#{event_id}',
-                    'SK': 'METADATA'
-                },
-                UpdateExpression='SET currentRegistrations = currentRegistrations + :inc',
-                ExpressionAttributeValues={':inc': 1}
+            response = self.table.update_item(
+                Key=event_metadata_key(event_id),
+                UpdateExpression='ADD currentRegistrations :one',
+                ConditionExpression=(
+                    'attribute_exists(PK) AND currentRegistrations < #cap'
+                ),
+                ExpressionAttributeNames={'#cap': 'capacity'},
+                ExpressionAttributeValues={':one': 1},
+                ReturnValues='UPDATED_NEW'
             )
+            invalidate_event_caches(event_id)
+            return int(response['Attributes']['currentRegistrations'])
         except ClientError as e:
-            raise RepositoryError(f"Failed to increment registrations: {str(e)}")
-    
-    def decrement_registrations(self, event_id: str) -> None:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise CapacityExceededError("Event is at full capacity")
+            raise_repository_error("increment registrations", e)
+
+    def decrement_registrations(self, event_id: str) -> Optional[int]:
         """Decrement the registration count for an event.
-        
+
+        Guarded so the counter never goes below zero; a failed guard is
+        treated as a no-op rather than an error. Returns the
+        post-decrement count from the same call, None on the no-op.
+
         Args:
             event_id: Event ID
-            
+
+        Returns:
+            The registration count after the decrement, or None if the
+            counter was already at zero
+
         Raises:
             RepositoryError: If database operation fails
         """
         try:
-            self.table.update_item(
-                Key={
-                    'PK': f'EVENT#{event_id}',
-                    'SK': 'METADATA'
-                },
+            response = self.table.update_item(
+                Key=event_metadata_key(event_id),
                 UpdateExpression='SET currentRegistrations = currentRegistrations - :dec',
-                ExpressionAttributeValues={':dec': 1}
+                ConditionExpression='currentRegistrations > :zero',
+                ExpressionAttributeValues={':dec': 1, ':zero': 0},
+                ReturnValues='UPDATED_NEW'
             )
+            invalidate_event_caches(event_id)
+            return int(response['Attributes']['currentRegistrations'])
         except ClientError as e:
-            raise RepositoryError(f"Failed to decrement registrations: {str(e)}")
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
+            raise_repository_error("decrement registrations", e)
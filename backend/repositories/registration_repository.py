@@ -1,12 +1,74 @@
 """Registration repository for data access operations."""
 
+import os
+import time
 from typing import Optional, List, Dict, Any
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key
 
-from backend.repositories.base import BaseRepository
+from backend.repositories.base import (
+    BaseRepository,
+    event_metadata_key,
+    event_registration_key,
+    raise_repository_error,
+    serialize_item,
+    user_event_key,
+    user_profile_key
+)
+from backend.repositories.event_repository import invalidate_event_caches
 from backend.models.domain import DomainRegistration
-from backend.exceptions import RepositoryError
+from backend.exceptions import (
+    CapacityExceededError,
+    ResourceAlreadyExistsError,
+    ResourceNotFoundError,
+    StaleWriteError
+)
+
+
+# Exactly the attributes DomainRegistration consumes; keeps PK/SK and any
+# future bookkeeping attributes off the wire on list queries. Aliased like
+# the event projection so none of the names can clash with reserved words.
+_REGISTRATION_ATTRS = (
+    'userId', 'eventId', 'registrationStatus', 'registeredAt', 'version'
+)
+_REGISTRATION_PROJECTION = ', '.join(f'#{a}' for a in _REGISTRATION_ATTRS)
+_REGISTRATION_PROJECTION_NAMES = {f'#{a}': a for a in _REGISTRATION_ATTRS}
+
+# Streaming projection: everything above minus version, whose Number type
+# surfaces as Decimal from boto3 and is not orjson-serializable. Streamed
+# items go straight into orjson.dumps, so only string attributes belong
+# here.
+_STREAM_ATTRS = ('userId', 'eventId', 'registrationStatus', 'registeredAt')
+_STREAM_PROJECTION = ', '.join(f'#{a}' for a in _STREAM_ATTRS)
+_STREAM_KCE_NAMES = {
+    **{f'#{a}': a for a in _STREAM_ATTRS}, '#pk': 'PK', '#sk': 'SK'
+}
+
+# Raw key-condition strings built once at import. Skips boto3's
+# condition-builder object graph (Key/Equals/BeginsWith/And plus its
+# expression traversal) on every query; only the values dict is built per
+# call. The name maps fold in the projection aliases so each query passes
+# a single precomputed ExpressionAttributeNames.
+_PREFIX_KCE = '#pk = :pk AND begins_with(#sk, :skp)'
+_PREFIX_KCE_NAMES = {**_REGISTRATION_PROJECTION_NAMES, '#pk': 'PK', '#sk': 'SK'}
+# For queries whose projection does not use the registration aliases;
+# DynamoDB rejects requests that declare names no expression references.
+_KEY_ONLY_NAMES = {'#pk': 'PK', '#sk': 'SK'}
+_SPARSE_KCE = '#gsi = :pk'
+_SPARSE_KCE_NAMES = {**_REGISTRATION_PROJECTION_NAMES, '#gsi': 'gsiUserRegistered'}
+
+# Optional sparse GSI for "events this user is registered for". The
+# gsiUserRegistered attribute is written only on registered user->event
+# rows (and removed on waitlisting), so the index contains exactly the
+# rows the registered-only query wants — no FilterExpression, no RCU spent
+# on waitlisted rows. Enable by setting the env var once the index exists.
+USER_REGISTERED_INDEX_NAME = os.environ.get('USER_REGISTERED_INDEX_NAME')
+
+
+def _sparse_index_value(user_id: str, status: str) -> Dict[str, str]:
+    """Sparse GSI attribute for a user->event row, if it is registered."""
+    if status == 'registered':
+        return {'gsiUserRegistered': f'USER#{user_id}'}
+    return {}
 
 
 class RegistrationRepository(BaseRepository):
@@ -14,64 +76,397 @@ class RegistrationRepository(BaseRepository):
     
     def create_registration(self, registration: DomainRegistration) -> DomainRegistration:
         """Create a new registration.
-        
+
+        Both lookup rows go out in a single TransactWriteItems: one round
+        trip, and the mirror rows can never diverge through a partial
+        failure.
+
         Args:
             registration: DomainRegistration to create
-            
+
         Returns:
             Created DomainRegistration
-            
+
         Raises:
             RepositoryError: If database operation fails
         """
+        user_id = registration.user_id
+        event_id = registration.event_id
+        reg_item = {
+            'userId': user_id,
+            'eventId': event_id,
+            'registrationStatus': registration.registration_status,
+            'registeredAt': registration.registered_at,
+            'version': registration.version
+        }
         try:
-            # Create user -> event lookup
-            self.table.put_item(
-                Item={
-                    'PK': f'USER#{registration.user_id}',
-                    'SK': f'EVENT#{registration.event_id}',
-                    'userId': registration.user_id,
-                    'eventId': registration.event_id,
-                    'registrationStatus': registration.registration_status,
-                    'registeredAt': registration.registered_at
-                }
+            self.client.transact_write_items(
+                TransactItems=[
+                    {
+                        'Put': {
+                            'TableName': self.table_name,
+                            'Item': serialize_item({
+                                **user_event_key(user_id, event_id),
+                                **reg_item,
+                                **_sparse_index_value(
+                                    user_id, registration.registration_status
+                                )
+                            })
+                        }
+                    },
+                    {
+                        'Put': {
+                            'TableName': self.table_name,
+                            'Item': serialize_item({
+                                **event_registration_key(event_id, user_id),
+                                **reg_item
+                            })
+                        }
+                    }
+                ]
             )
-            
-            # Create event -> user lookup
-            self.table.put_item(
-                Item={
-                    'PK': f'EVENT#{registration.event_id}',
-                    'SK': f'REGISTRATION#{registration.user_id}',
-                    'userId': registration.user_id,
-                    'eventId': registration.event_id,
-                    'registrationStatus': registration.registration_status,
-                    'registeredAt': registration.registered_at
+            return registration
+        except ClientError as e:
+            raise_repository_error("create registration", e)
+
+    def create_registration_fast(self, registration: DomainRegistration) -> DomainRegistration:
+        """Create a registration without transactional semantics.
+
+        Both lookup rows go out in one BatchWriteItem. Unlike
+        create_registration this costs 1x WCU per item instead of the 2x
+        that TransactWriteItems charges, but a partial failure can leave
+        the mirror rows briefly divergent, so it is only suitable for
+        best-effort paths where a later read can repair the pair (e.g.
+        waitlist entries, where the waitlist row itself is the source of
+        truth). Unprocessed items are retried with exponential backoff.
+
+        Args:
+            registration: DomainRegistration to create
+
+        Returns:
+            Created DomainRegistration
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        user_id = registration.user_id
+        event_id = registration.event_id
+        reg_item = {
+            'userId': user_id,
+            'eventId': event_id,
+            'registrationStatus': registration.registration_status,
+            'registeredAt': registration.registered_at,
+            'version': registration.version
+        }
+        self._batch_write([
+            {
+                'PutRequest': {
+                    'Item': serialize_item({
+                        **user_event_key(user_id, event_id),
+                        **reg_item,
+                        **_sparse_index_value(
+                            user_id, registration.registration_status
+                        )
+                    })
+                }
+            },
+            {
+                'PutRequest': {
+                    'Item': serialize_item({
+                        **event_registration_key(event_id, user_id),
+                        **reg_item
+                    })
+                }
+            }
+        ])
+        return registration
+
+    def register_many(self, registrations: List[DomainRegistration]) -> None:
+        """Bulk-create registrations for admin/import flows.
+
+        Packs both lookup rows for every registration into BatchWriteItem
+        calls of up to 25 items (the service limit), so N registrations
+        cost ceil(2N/25) round trips instead of N transactions. Best
+        effort like create_registration_fast: no capacity enforcement and
+        no atomicity across the pair — callers own counter reconciliation.
+
+        Args:
+            registrations: DomainRegistration objects to create
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        put_requests = []
+        for registration in registrations:
+            user_id = registration.user_id
+            event_id = registration.event_id
+            reg_item = {
+                'userId': user_id,
+                'eventId': event_id,
+                'registrationStatus': registration.registration_status,
+                'registeredAt': registration.registered_at,
+                'version': registration.version
+            }
+            put_requests.append({
+                'PutRequest': {
+                    'Item': serialize_item({
+                        **user_event_key(user_id, event_id),
+                        **reg_item,
+                        **_sparse_index_value(
+                            user_id, registration.registration_status
+                        )
+                    })
+                }
+            })
+            put_requests.append({
+                'PutRequest': {
+                    'Item': serialize_item({
+                        **event_registration_key(event_id, user_id),
+                        **reg_item
+                    })
                 }
+            })
+        # BatchWriteItem accepts at most 25 items per call.
+        for start in range(0, len(put_requests), 25):
+            self._batch_write(put_requests[start:start + 25])
+
+    def _batch_write(self, put_requests: List[Dict[str, Any]]) -> None:
+        """Issue one BatchWriteItem, retrying unprocessed items.
+
+        Args:
+            put_requests: Pre-serialized PutRequest entries (max 25)
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        request_items = {self.table_name: put_requests}
+        backoff = 0.05
+        try:
+            while request_items:
+                response = self.client.batch_write_item(
+                    RequestItems=request_items
+                )
+                request_items = response.get('UnprocessedItems', {})
+                if request_items:
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, 1.0)
+        except ClientError as e:
+            raise_repository_error("create registration", e)
+
+    def register_with_capacity(self, registration: DomainRegistration) -> DomainRegistration:
+        """Atomically register a user for an event while enforcing capacity.
+
+        A single TransactWriteItems verifies the user profile exists,
+        increments the event's registration count (guarded by
+        `currentRegistrations < capacity`), and writes both registration
+        rows, replacing five sequential round trips. DynamoDB enforces
+        every condition atomically, so concurrent registrations cannot
+        overshoot capacity.
+
+        Args:
+            registration: DomainRegistration to create
+
+        Returns:
+            Created DomainRegistration
+
+        Raises:
+            ResourceNotFoundError: If the user does not exist
+            CapacityExceededError: If the event is missing or at capacity
+            ResourceAlreadyExistsError: If the user is already registered
+            RepositoryError: If database operation fails
+        """
+        user_id = registration.user_id
+        event_id = registration.event_id
+        reg_item = {
+            'userId': user_id,
+            'eventId': event_id,
+            'registrationStatus': registration.registration_status,
+            'registeredAt': registration.registered_at,
+            'version': registration.version
+        }
+        try:
+            self.client.transact_write_items(
+                TransactItems=[
+                    {
+                        'ConditionCheck': {
+                            'TableName': self.table_name,
+                            'Key': serialize_item(user_profile_key(user_id)),
+                            'ConditionExpression': 'attribute_exists(PK)'
+                        }
+                    },
+                    {
+                        'Update': {
+                            'TableName': self.table_name,
+                            'Key': serialize_item(event_metadata_key(event_id)),
+                            'UpdateExpression': 'ADD currentRegistrations :one',
+                            'ConditionExpression': (
+                                'attribute_exists(PK) AND currentRegistrations < #cap'
+                            ),
+                            'ExpressionAttributeNames': {'#cap': 'capacity'},
+                            'ExpressionAttributeValues': {':one': {'N': '1'}}
+                        }
+                    },
+                    {
+                        'Put': {
+                            'TableName': self.table_name,
+                            'Item': serialize_item({
+                                **user_event_key(user_id, event_id),
+                                **reg_item,
+                                **_sparse_index_value(
+                                    user_id, registration.registration_status
+                                )
+                            }),
+                            'ConditionExpression': 'attribute_not_exists(PK)'
+                        }
+                    },
+                    {
+                        'Put': {
+                            'TableName': self.table_name,
+                            'Item': serialize_item({
+                                **event_registration_key(event_id, user_id),
+                                **reg_item
+                            })
+                        }
+                    }
+                ]
             )
-            
+            # The transaction moved the event counter, so the event
+            # repository's cached copy is stale.
+            invalidate_event_caches(event_id)
             return registration
         except ClientError as e:
-            raise RepositoryError(f"Failed to create registration: {str(e)}")
-    
-    def get_registration(self, user_id: str, event_id: str) -> Optional[DomainRegistration]:
+            if e.response['Error']['Code'] == 'TransactionCanceledException':
+                # Cancellation reasons come back in TransactItems order:
+                # [0] user profile check, [1] event capacity update,
+                # [2] registration put.
+                codes = [
+                    reason.get('Code')
+                    for reason in e.response.get('CancellationReasons', [])
+                ]
+                if codes and codes[0] == 'ConditionalCheckFailed':
+                    raise ResourceNotFoundError(
+                        f"User with ID {user_id} not found"
+                    )
+                if len(codes) > 2 and codes[2] == 'ConditionalCheckFailed':
+                    raise ResourceAlreadyExistsError(
+                        "User is already registered for this event"
+                    )
+                if len(codes) > 1 and codes[1] == 'ConditionalCheckFailed':
+                    raise CapacityExceededError("Event is at full capacity")
+            raise_repository_error("create registration", e)
+
+    def register_waitlisted(
+        self,
+        registration: DomainRegistration,
+        timestamp: str
+    ) -> DomainRegistration:
+        """Atomically waitlist a user: ordering entry plus both lookup rows.
+
+        One TransactWriteItems writes the WAITLIST# ordering entry and
+        both registration lookup rows, collapsing the previous two calls
+        into one and guaranteeing a waitlisted registration can never
+        exist without its promotion-ordering entry (or vice versa). The
+        user->event put is conditional, so re-waitlisting an existing
+        registration is rejected rather than silently overwritten.
+
+        Args:
+            registration: DomainRegistration with status 'waitlisted'
+            timestamp: Timestamp for waitlist ordering
+
+        Returns:
+            Created DomainRegistration
+
+        Raises:
+            ResourceAlreadyExistsError: If the user already has a
+                registration for this event
+            RepositoryError: If database operation fails
+        """
+        user_id = registration.user_id
+        event_id = registration.event_id
+        reg_item = {
+            'userId': user_id,
+            'eventId': event_id,
+            'registrationStatus': registration.registration_status,
+            'registeredAt': registration.registered_at,
+            'version': registration.version
+        }
+        try:
+            self.client.transact_write_items(
+                TransactItems=[
+                    {
+                        'Put': {
+                            'TableName': self.table_name,
+                            'Item': serialize_item({
+                                'PK': f'EVENT#{event_id}',
+                                'SK': f'WAITLIST#{timestamp}#{user_id}',
+                                'userId': user_id,
+                                'eventId': event_id,
+                                'addedAt': timestamp
+                            })
+                        }
+                    },
+                    {
+                        'Put': {
+                            'TableName': self.table_name,
+                            'Item': serialize_item({
+                                **user_event_key(user_id, event_id),
+                                **reg_item
+                            }),
+                            'ConditionExpression': 'attribute_not_exists(PK)'
+                        }
+                    },
+                    {
+                        'Put': {
+                            'TableName': self.table_name,
+                            'Item': serialize_item({
+                                **event_registration_key(event_id, user_id),
+                                **reg_item
+                            })
+                        }
+                    }
+                ]
+            )
+            return registration
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'TransactionCanceledException':
+                # [1] is the conditional user->event put.
+                codes = [
+                    reason.get('Code')
+                    for reason in e.response.get('CancellationReasons', [])
+                ]
+                if len(codes) > 1 and codes[1] == 'ConditionalCheckFailed':
+                    raise ResourceAlreadyExistsError(
+                        "User is already registered for this event"
+                    )
+            raise_repository_error("add to waitlist", e)
+
+    def get_registration(
+        self,
+        user_id: str,
+        event_id: str,
+        consistent: bool = False
+    ) -> Optional[DomainRegistration]:
         """Get registration by user and event ID.
-        
+
+        Defaults to an eventually-consistent read — half the RCU and the
+        faster path. Pass consistent=True when the read must observe a
+        write issued immediately before it.
+
         Args:
             user_id: User ID
             event_id: Event ID
-            
+            consistent: Use a strongly consistent read
+
         Returns:
             DomainRegistration if found, None otherwise
-            
+
         Raises:
             RepositoryError: If database operation fails
         """
         try:
             response = self.table.get_item(
-                Key={
-                    'PK': f'USER#{user_id}',
-                    'SK': f'EVENT#{event_id}'
-                }
+                Key=user_event_key(user_id, event_id),
+                ConsistentRead=consistent
             )
             
             if 'Item' not in response:
@@ -82,70 +477,295 @@ class RegistrationRepository(BaseRepository):
                 user_id=item['userId'],
                 event_id=item['eventId'],
                 registration_status=item['registrationStatus'],
-                registered_at=item['registeredAt']
+                registered_at=item['registeredAt'],
+                version=int(item.get('version', 1))
             )
         except ClientError as e:
-            raise RepositoryError(f"Failed to get registration: {str(e)}")
+            raise_repository_error("get registration", e)
     
-    def delete_registration(self, user_id: str, event_id: str) -> None:
-        """Delete a registration.
-        
+    def delete_registration(self, user_id: str, event_id: str) -> Optional[DomainRegistration]:
+        """Delete a registration, returning its prior state.
+
+        The first delete asks for ReturnValues='ALL_OLD', so callers learn
+        the registration's previous status (needed for waitlist promotion)
+        without a separate GetItem round trip.
+
         Args:
             user_id: User ID
             event_id: Event ID
-            
+
+        Returns:
+            The deleted DomainRegistration, or None if it did not exist
+
         Raises:
             RepositoryError: If database operation fails
         """
         try:
-            # Delete user -> event lookup
-            self.table.delete_item(
-                Key={
-                    'PK': f'USER#{user_id}',
-                    'SK': f'EVENT#{event_id}'
-                }
+            # Delete user -> event lookup, capturing the old item
+            response = self.table.delete_item(
+                Key=user_event_key(user_id, event_id),
+                ReturnValues='ALL_OLD'
             )
-            
+
             # Delete event -> user lookup
             self.table.delete_item(
-                Key={
-                    'PK': f'EVENT#{event_id}',
-                    'SK': f'REGISTRATION#{user_id}'
-                }
+                Key=event_registration_key(event_id, user_id)
+            )
+
+            item = response.get('Attributes')
+            if not item:
+                return None
+            return DomainRegistration(
+                user_id=item['userId'],
+                event_id=item['eventId'],
+                registration_status=item['registrationStatus'],
+                registered_at=item['registeredAt'],
+                version=int(item.get('version', 1))
             )
         except ClientError as e:
-            raise RepositoryError(f"Failed to delete registration: {str(e)}")
+            raise_repository_error("delete registration", e)
     
-    def list_user_registrations(self, user_id: str) -> List[DomainRegistration]:
-        """List all registrations for a user.
-        
+    def unregister_transactionally(
+        self,
+        user_id: str,
+        event_id: str,
+        waitlist_entry: Optional[Dict[str, Any]] = None,
+        free_spot: bool = False,
+        waitlisted_at: Optional[str] = None
+    ) -> bool:
+        """Atomically remove a registration and settle its freed spot.
+
+        One TransactWriteItems deletes both lookup rows and, in the same
+        transaction, either promotes the given waitlist head into the
+        freed spot (counter untouched — the promoted user takes it over)
+        or, with free_spot=True, decrements the event counter. A crash
+        can no longer land between the delete and the promotion or
+        decrement and leave the count wrong.
+
+        For a waitlisted registration, waitlisted_at locates its
+        WAITLIST# ordering entry (keyed on the registration timestamp)
+        so the transaction removes it too; otherwise the dead entry
+        would sit at the head of the queue and block every promotion.
+
+        The user->event delete is guarded on both existence and the
+        status the caller's read implied, so a concurrent unregister of
+        the same row — or a status flip that would make this settlement
+        the wrong one — cancels the whole transaction; the waitlist
+        delete is guarded the same way, so two unregisters cannot both
+        consume one head.
+
+        Args:
+            user_id: User ID being unregistered
+            event_id: Event ID
+            waitlist_entry: Waitlist head to promote into the freed spot
+            free_spot: Decrement the event counter (no promotion)
+            waitlisted_at: registered_at of a waitlisted registration,
+                used to delete its ordering entry in the same transaction
+
+        Returns:
+            True on success, False if waitlist_entry was consumed by a
+            concurrent promoter first
+
+        Raises:
+            ResourceNotFoundError: If the registration does not exist
+            StaleWriteError: If the registration's status changed after
+                the caller read it
+            RepositoryError: If database operation fails
+        """
+        # The caller chose this transaction's shape from the status it
+        # read, so the delete is guarded on that same status: waitlisted
+        # when removing the ordering entry, registered otherwise. A
+        # concurrent flip (e.g. a promotion landing between read and
+        # transaction) cancels the whole thing instead of deleting a
+        # registered row without settling its seat.
+        expected_status = 'waitlisted' if waitlisted_at is not None else 'registered'
+        transact_items: List[Dict[str, Any]] = [
+            {
+                'Delete': {
+                    'TableName': self.table_name,
+                    'Key': serialize_item(user_event_key(user_id, event_id)),
+                    'ConditionExpression': (
+                        'attribute_exists(PK) AND registrationStatus = :expected'
+                    ),
+                    'ExpressionAttributeValues': {
+                        ':expected': {'S': expected_status}
+                    },
+                    'ReturnValuesOnConditionCheckFailure': 'ALL_OLD'
+                }
+            },
+            {
+                'Delete': {
+                    'TableName': self.table_name,
+                    'Key': serialize_item(event_registration_key(event_id, user_id))
+                }
+            }
+        ]
+        if waitlist_entry is not None:
+            promoted_id = waitlist_entry['userId']
+            transact_items.extend([
+                {
+                    'Update': {
+                        'TableName': self.table_name,
+                        'Key': serialize_item(
+                            user_event_key(promoted_id, event_id)
+                        ),
+                        'UpdateExpression': (
+                            'SET registrationStatus = :status, gsiUserRegistered = :gsi'
+                        ),
+                        'ConditionExpression': 'attribute_exists(PK)',
+                        'ExpressionAttributeValues': {
+                            ':status': {'S': 'registered'},
+                            ':gsi': {'S': f'USER#{promoted_id}'}
+                        }
+                    }
+                },
+                {
+                    'Update': {
+                        'TableName': self.table_name,
+                        'Key': serialize_item(
+                            event_registration_key(event_id, promoted_id)
+                        ),
+                        'UpdateExpression': 'SET registrationStatus = :status',
+                        'ExpressionAttributeValues': {
+                            ':status': {'S': 'registered'}
+                        }
+                    }
+                },
+                {
+                    'Delete': {
+                        'TableName': self.table_name,
+                        'Key': serialize_item({
+                            'PK': waitlist_entry['PK'],
+                            'SK': waitlist_entry['SK']
+                        }),
+                        'ConditionExpression': 'attribute_exists(PK)'
+                    }
+                }
+            ])
+        elif free_spot:
+            transact_items.append({
+                'Update': {
+                    'TableName': self.table_name,
+                    'Key': serialize_item(event_metadata_key(event_id)),
+                    'UpdateExpression': 'ADD currentRegistrations :neg',
+                    'ConditionExpression': 'currentRegistrations > :zero',
+                    'ExpressionAttributeValues': {
+                        ':neg': {'N': '-1'},
+                        ':zero': {'N': '0'}
+                    }
+                }
+            })
+        if waitlisted_at is not None:
+            # Unconditional: if the entry was already promoted away the
+            # delete is a no-op, and the row's status guard above still
+            # decides whether the transaction stands.
+            transact_items.append({
+                'Delete': {
+                    'TableName': self.table_name,
+                    'Key': serialize_item({
+                        'PK': f'EVENT#{event_id}',
+                        'SK': f'WAITLIST#{waitlisted_at}#{user_id}'
+                    })
+                }
+            })
+
+        try:
+            self.client.transact_write_items(TransactItems=transact_items)
+            if free_spot:
+                # The decrement moved the event counter, so the event
+                # repository's cached copy is stale.
+                invalidate_event_caches(event_id)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'TransactionCanceledException':
+                # Positions follow transact_items: [0] registration delete,
+                # [2..4] promotion ops or [2] the guarded decrement.
+                codes = [
+                    reason.get('Code')
+                    for reason in e.response.get('CancellationReasons', [])
+                ]
+                if codes and codes[0] == 'ConditionalCheckFailed':
+                    reasons = e.response.get('CancellationReasons', [])
+                    if reasons[0].get('Item'):
+                        # The row exists but no longer has the status the
+                        # caller read, so this transaction's settlement is
+                        # the wrong one for it.
+                        raise StaleWriteError(
+                            "Registration was modified concurrently; re-read and retry"
+                        )
+                    raise ResourceNotFoundError("Registration not found")
+                if waitlist_entry is not None and 'ConditionalCheckFailed' in codes:
+                    return False
+                if free_spot and len(codes) > 2 and codes[2] == 'ConditionalCheckFailed':
+                    # Counter already at zero — an inconsistency this
+                    # delete should not preserve. Retry without it.
+                    return self.unregister_transactionally(user_id, event_id)
+            raise_repository_error("delete registration", e)
+
+    def list_user_registrations(
+        self,
+        user_id: str,
+        status: Optional[str] = None
+    ) -> List[DomainRegistration]:
+        """List registrations for a user, optionally by status.
+
+        The status filter is applied server-side so non-matching rows
+        never cross the wire (it does not reduce RCU, but it does reduce
+        response bytes and per-row deserialization).
+
         Args:
             user_id: User ID
-            
+            status: Optional registration status to filter by
+
         Returns:
             List of DomainRegistration objects
-            
+
         Raises:
             RepositoryError: If database operation fails
         """
         try:
-            response = self.table.query(
-                KeyConditionExpression=Key('PK').eq(f'USER#{user_id}') & Key('SK').begins_with('EVENT#')
-            )
+            if status == 'registered' and USER_REGISTERED_INDEX_NAME:
+                # The sparse GSI holds only registered rows, so the query
+                # reads exactly the items it returns — no filter needed.
+                query_kwargs: Dict[str, Any] = {
+                    'IndexName': USER_REGISTERED_INDEX_NAME,
+                    'KeyConditionExpression': _SPARSE_KCE,
+                    'ExpressionAttributeNames': _SPARSE_KCE_NAMES,
+                    'ExpressionAttributeValues': {':pk': f'USER#{user_id}'},
+                    'ProjectionExpression': _REGISTRATION_PROJECTION
+                }
+            else:
+                query_kwargs = {
+                    'KeyConditionExpression': _PREFIX_KCE,
+                    'ExpressionAttributeNames': _PREFIX_KCE_NAMES,
+                    'ExpressionAttributeValues': {
+                        ':pk': f'USER#{user_id}',
+                        ':skp': 'EVENT#'
+                    },
+                    'ProjectionExpression': _REGISTRATION_PROJECTION
+                }
+                if status:
+                    query_kwargs['FilterExpression'] = 'registrationStatus = :statusv'
+                    query_kwargs['ExpressionAttributeValues'][':statusv'] = status
+            response = self.table.query(**query_kwargs)
             
             items = response.get('Items', [])
-            
+
+            # Local aliases keep the per-row work to C-level calls inside
+            # the comprehension.
+            make = DomainRegistration
             return [
-                DomainRegistration(
+                make(
                     user_id=item['userId'],
                     event_id=item['eventId'],
                     registration_status=item['registrationStatus'],
-                    registered_at=item['registeredAt']
+                    registered_at=item['registeredAt'],
+                    version=int(item.get('version', 1))
                 )
                 for item in items
             ]
         except ClientError as e:
-            raise RepositoryError(f"Failed to list user registrations: {str(e)}")
+            raise_repository_error("list user registrations", e)
     
     def list_event_registrations(self, event_id: str) -> List[DomainRegistration]:
         """List all registrations for an event.
@@ -161,23 +781,111 @@ class RegistrationRepository(BaseRepository):
         """
         try:
             response = self.table.query(
-                KeyConditionExpression=Key('PK').eq(f'EVENT#{event_id}') & Key('SK').begins_with('REGISTRATION#')
+                KeyConditionExpression=_PREFIX_KCE,
+                ExpressionAttributeNames=_PREFIX_KCE_NAMES,
+                ExpressionAttributeValues={
+                    ':pk': f'EVENT#{event_id}',
+                    ':skp': 'REGISTRATION#'
+                },
+                ProjectionExpression=_REGISTRATION_PROJECTION
             )
             
             items = response.get('Items', [])
-            
+
+            # Local aliases keep the per-row work to C-level calls inside
+            # the comprehension.
+            make = DomainRegistration
             return [
-                DomainRegistration(
+                make(
                     user_id=item['userId'],
                     event_id=item['eventId'],
                     registration_status=item['registrationStatus'],
-                    registered_at=item['registeredAt']
+                    registered_at=item['registeredAt'],
+                    version=int(item.get('version', 1))
                 )
                 for item in items
             ]
         except ClientError as e:
-            raise RepositoryError(f"Failed to list event registrations: {str(e)}")
+            raise_repository_error("list event registrations", e)
     
+    def list_event_registrations_columnar(self, event_id: str) -> Dict[str, List[str]]:
+        """List an event's registrations as a column-oriented payload.
+
+        Returns one list per attribute instead of one object per row, so
+        a 1000-row response allocates 4 lists rather than 1000
+        DomainRegistration instances plus their API-model reboxing.
+        Callers hand the dict straight to the JSON encoder.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            Dict mapping attribute name to the per-row value list, all
+            lists in the same row order
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        try:
+            response = self.table.query(
+                KeyConditionExpression=_PREFIX_KCE,
+                ExpressionAttributeNames=_PREFIX_KCE_NAMES,
+                ExpressionAttributeValues={
+                    ':pk': f'EVENT#{event_id}',
+                    ':skp': 'REGISTRATION#'
+                },
+                ProjectionExpression=_REGISTRATION_PROJECTION
+            )
+
+            items = response.get('Items', [])
+            return {
+                'userId': [item['userId'] for item in items],
+                'eventId': [item['eventId'] for item in items],
+                'registrationStatus': [
+                    item['registrationStatus'] for item in items
+                ],
+                'registeredAt': [item['registeredAt'] for item in items]
+            }
+        except ClientError as e:
+            raise_repository_error("list event registrations", e)
+
+    def iter_event_registrations(self, event_id: str):
+        """Iterate an event's registration items page by page.
+
+        Yields raw projected items as each DynamoDB page arrives, so
+        callers can stream arbitrarily large registration lists without
+        materializing them. Items carry only the projected string
+        attributes and are JSON-serializable as-is.
+
+        Args:
+            event_id: Event ID
+
+        Yields:
+            Registration items as plain dicts
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        query_kwargs: Dict[str, Any] = {
+            'KeyConditionExpression': _PREFIX_KCE,
+            'ExpressionAttributeNames': _STREAM_KCE_NAMES,
+            'ExpressionAttributeValues': {
+                ':pk': f'EVENT#{event_id}',
+                ':skp': 'REGISTRATION#'
+            },
+            'ProjectionExpression': _STREAM_PROJECTION
+        }
+        while True:
+            try:
+                response = self.table.query(**query_kwargs)
+            except ClientError as e:
+                raise_repository_error("list event registrations", e)
+            yield from response.get('Items', [])
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                return
+            query_kwargs['ExclusiveStartKey'] = last_key
+
     def add_to_waitlist(self, user_id: str, event_id: str, timestamp: str) -> None:
         """Add a user to the event waitlist.
         
@@ -200,7 +908,7 @@ class RegistrationRepository(BaseRepository):
                 }
             )
         except ClientError as e:
-            raise RepositoryError(f"Failed to add to waitlist: {str(e)}")
+            raise_repository_error("add to waitlist", e)
     
     def get_first_waitlisted(self, event_id: str) -> Optional[Dict[str, Any]]:
         """Get the first user on the waitlist for an event.
@@ -215,16 +923,132 @@ class RegistrationRepository(BaseRepository):
             RepositoryError: If database operation fails
         """
         try:
+            # PK/SK are projected too: callers need them to delete the
+            # entry when promoting. The read is strongly consistent because
+            # promotion acts on the result — a stale head could promote a
+            # user who just left the waitlist.
             response = self.table.query(
-                KeyConditionExpression=Key('PK').eq(f'EVENT#{event_id}') & Key('SK').begins_with('WAITLIST#'),
+                KeyConditionExpression=_PREFIX_KCE,
+                ExpressionAttributeNames=_KEY_ONLY_NAMES,
+                ExpressionAttributeValues={
+                    ':pk': f'EVENT#{event_id}',
+                    ':skp': 'WAITLIST#'
+                },
+                ProjectionExpression='#pk, #sk, userId, eventId, addedAt',
+                ConsistentRead=True,
                 Limit=1
             )
             
             items = response.get('Items', [])
             return items[0] if items else None
         except ClientError as e:
-            raise RepositoryError(f"Failed to get first waitlisted: {str(e)}")
+            raise_repository_error("get first waitlisted", e)
     
+    def promote_waitlisted(self, waitlist_entry: Dict[str, Any]) -> bool:
+        """Atomically promote a waitlisted user into a registered spot.
+
+        One TransactWriteItems flips both registration rows to
+        'registered' and deletes the waitlist entry, replacing three
+        serial writes. A crash can no longer leave a promoted
+        registration with a dangling waitlist entry. The event counter is
+        untouched: the promoted user takes over the freed spot, so the
+        net change is zero.
+
+        The delete is guarded with attribute_exists, so two concurrent
+        promoters reading the same head cannot both consume it — the
+        loser's whole transaction is cancelled and this returns False so
+        the caller can re-read the (new) head and retry.
+
+        Args:
+            waitlist_entry: Raw waitlist item (PK, SK, userId, eventId)
+
+        Returns:
+            True if the entry was promoted, False if another promoter
+            consumed it first
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        user_id = waitlist_entry['userId']
+        event_id = waitlist_entry['eventId']
+        try:
+            self.client.transact_write_items(
+                TransactItems=[
+                    {
+                        'Update': {
+                            'TableName': self.table_name,
+                            'Key': serialize_item(user_event_key(user_id, event_id)),
+                            'UpdateExpression': (
+                                'SET registrationStatus = :status, gsiUserRegistered = :gsi'
+                            ),
+                            'ConditionExpression': 'attribute_exists(PK)',
+                            'ExpressionAttributeValues': {
+                                ':status': {'S': 'registered'},
+                                ':gsi': {'S': f'USER#{user_id}'}
+                            }
+                        }
+                    },
+                    {
+                        'Update': {
+                            'TableName': self.table_name,
+                            'Key': serialize_item(event_registration_key(event_id, user_id)),
+                            'UpdateExpression': 'SET registrationStatus = :status',
+                            'ExpressionAttributeValues': {':status': {'S': 'registered'}}
+                        }
+                    },
+                    {
+                        'Delete': {
+                            'TableName': self.table_name,
+                            'Key': serialize_item({
+                                'PK': waitlist_entry['PK'],
+                                'SK': waitlist_entry['SK']
+                            }),
+                            'ConditionExpression': 'attribute_exists(PK)'
+                        }
+                    }
+                ]
+            )
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'TransactionCanceledException':
+                codes = [
+                    reason.get('Code')
+                    for reason in e.response.get('CancellationReasons', [])
+                ]
+                if 'ConditionalCheckFailed' in codes:
+                    return False
+            raise_repository_error("promote waitlisted user", e)
+
+    def promote_waitlist_head(self, event_id: str, attempts: int = 3) -> Optional[str]:
+        """Promote the current waitlist head into a registered spot.
+
+        Fuses the head read and the promotion transaction into one repo
+        call, re-reading the next head when a concurrent promoter
+        consumes it first (bounded retries). Standalone complement to
+        unregister_transactionally's fused promotion: use this when a
+        spot opens without an unregistration, e.g. after an event's
+        capacity is raised. The event counter is untouched — the
+        promoted user fills an already-counted spot.
+
+        Args:
+            event_id: Event ID
+            attempts: Maximum head reads before giving up
+
+        Returns:
+            The promoted user's ID, or None if the waitlist was empty or
+            every attempt lost its race
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        for _ in range(attempts):
+            entry = self.get_first_waitlisted(event_id)
+            if entry is None:
+                return None
+            if self.promote_waitlisted(entry):
+                return entry['userId']
+        return None
+
     def remove_from_waitlist(self, pk: str, sk: str) -> None:
         """Remove an entry from the waitlist.
         
@@ -243,38 +1067,88 @@ class RegistrationRepository(BaseRepository):
                 }
             )
         except ClientError as e:
-            raise RepositoryError(f"Failed to remove from waitlist: {str(e)}")
+            raise_repository_error("remove from waitlist", e)
     
-    def update_registration_status(self, user_id: str, event_id: str, status: str) -> None:
+    def update_registration_status(
+        self,
+        user_id: str,
+        event_id: str,
+        status: str,
+        expected_version: Optional[int] = None
+    ) -> None:
         """Update the status of a registration.
-        
+
+        Both mirror rows are written in one TransactWriteItems, so they
+        update atomically and cost a single round trip. When
+        expected_version is given each update is additionally guarded with
+        optimistic concurrency: it only applies if the version still
+        matches what the caller read (rows written before versioning count
+        as version 1), and the version is bumped. A lost race raises
+        StaleWriteError so callers can re-read and retry.
+
         Args:
             user_id: User ID
             event_id: Event ID
             status: New registration status
-            
+            expected_version: Version the caller read, for OCC
+
         Raises:
+            StaleWriteError: If the OCC guard lost a concurrent race
             RepositoryError: If database operation fails
         """
+        set_parts = ['registrationStatus = :status']
+        values: Dict[str, Any] = {':status': {'S': status}}
+        occ: Dict[str, Any] = {}
+        if expected_version is not None:
+            set_parts.append('version = :newver')
+            values[':newver'] = {'N': str(expected_version + 1)}
+            values[':expected'] = {'N': str(expected_version)}
+            occ = {
+                'ConditionExpression': 'version = :expected OR attribute_not_exists(version)'
+            }
+        mirror_expr = 'SET ' + ', '.join(set_parts)
+        mirror_values = dict(values)
+
+        # Keep the sparse GSI attribute in sync on the user -> event row:
+        # present on registered rows, absent otherwise.
+        if status == 'registered':
+            user_expr = 'SET ' + ', '.join(set_parts + ['gsiUserRegistered = :gsi'])
+            user_values = {**values, ':gsi': {'S': f'USER#{user_id}'}}
+        else:
+            user_expr = mirror_expr + ' REMOVE gsiUserRegistered'
+            user_values = dict(values)
+
         try:
-            # Update user -> event lookup
-            self.table.update_item(
-                Key={
-                    'PK': f'USER#{user_id}',
-                    'SK': f'EVENT#{event_id}'
-                },
-                UpdateExpression='SET registrationStatus = :status',
-                ExpressionAttributeValues={':status': status}
-            )
-            
-            # Update event -> user lookup
-            self.table.update_item(
-                Key={
-                    'PK': f'EVENT#{event_id}',
-                    'SK': f'REGISTRATION#{user_id}'
-                },
-                UpdateExpression='SET registrationStatus = :status',
-                ExpressionAttributeValues={':status': status}
+            self.client.transact_write_items(
+                TransactItems=[
+                    {
+                        'Update': {
+                            'TableName': self.table_name,
+                            'Key': serialize_item(user_event_key(user_id, event_id)),
+                            'UpdateExpression': user_expr,
+                            'ExpressionAttributeValues': user_values,
+                            **occ
+                        }
+                    },
+                    {
+                        'Update': {
+                            'TableName': self.table_name,
+                            'Key': serialize_item(event_registration_key(event_id, user_id)),
+                            'UpdateExpression': mirror_expr,
+                            'ExpressionAttributeValues': mirror_values,
+                            **occ
+                        }
+                    }
+                ]
             )
         except ClientError as e:
-            raise RepositoryError(f"Failed to update registration status: {str(e)}")
+            if e.response['Error']['Code'] == 'TransactionCanceledException':
+                codes = [
+                    reason.get('Code')
+                    for reason in e.response.get('CancellationReasons', [])
+                ]
+                if 'ConditionalCheckFailed' in codes:
+                    raise StaleWriteError(
+                        "Registration was modified concurrently; re-read and retry"
+                    )
+            raise_repository_error("update registration status", e)
@@ -1,16 +1,34 @@
 """User repository for data access operations."""
 
+import os
+import threading
 from typing import Optional
+
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 
-from backend.repositories.base import BaseRepository
+from backend.repositories.base import BaseRepository, raise_repository_error, user_profile_key
 from backend.models.domain import DomainUser
-from backend.exceptions import ResourceAlreadyExistsError, RepositoryError
+from backend.exceptions import ResourceAlreadyExistsError
+
+# Process-local cache for user profile reads, mirroring the event cache.
+# Profiles are effectively immutable after creation, so the TTL can be far
+# longer than the event cache's. Creation invalidates its entry so a
+# cached "not found" cannot outlive a successful create.
+_USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL_SECONDS', '60'))
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_USER_CACHE_TTL)
+_user_cache_lock = threading.Lock()
+
+
+def _invalidate_cached_user(user_id: str) -> None:
+    """Drop a user from the process-local cache after a write."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
 
 
 class UserRepository(BaseRepository):
     """Repository for user data access."""
-    
+
     def create(self, user: DomainUser) -> DomainUser:
         """Create a new user.
         
@@ -35,11 +53,12 @@ class UserRepository(BaseRepository):
                 },
                 ConditionExpression='attribute_not_exists(PK)'
             )
+            _invalidate_cached_user(user.user_id)
             return user
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
                 raise ResourceAlreadyExistsError(f"User with ID {user.user_id} already exists")
-            raise RepositoryError(f"Failed to create user: {str(e)}")
+            raise_repository_error("create user", e)
     
     def get_by_id(self, user_id: str) -> Optional[DomainUser]:
         """Get user by ID.
@@ -49,33 +68,45 @@ class UserRepository(BaseRepository):
             
         Returns:
             DomainUser if found, None otherwise
-            
+
         Raises:
             RepositoryError: If database operation fails
         """
+        with _user_cache_lock:
+            cached = _user_cache.get(user_id)
+        if cached is not None:
+            return cached
+
         try:
             response = self.table.get_item(
-                Key={
-                    'PK': f'USER#{user_id}',
-                    'SK': 'PROFILE'
-                }
+                Key=user_profile_key(user_id)
             )
-            
+
             if 'Item' not in response:
                 return None
-            
+
             item = response['Item']
-            return DomainUser(
+            user = DomainUser(
                 user_id=item['userId'],
                 name=item['name'],
                 created_at=item['createdAt']
             )
         except ClientError as e:
-            raise RepositoryError(f"Failed to get user: {str(e)}")
+            raise_repository_error("get user", e)
+
+        with _user_cache_lock:
+            _user_cache[user_id] = user
+        return user
     
     def exists(self, user_id: str) -> bool:
         """Check if user exists.
-        
+
+        Diagnostic helper only — never call this as a pre-check before a
+        write. create() already enforces uniqueness with a conditional
+        PutItem, and the registration transaction carries its own
+        ConditionCheck on the profile row, so a prior exists() would just
+        add a round trip and a race window.
+
         Args:
             user_id: User ID
             
@@ -1,12 +1,13 @@
 """Event API routes."""
 
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Query, Depends
+from fastapi import APIRouter, HTTPException, Response, status, Query, Depends
+from fastapi.responses import StreamingResponse
 
-from backend.models.api import Event, EventCreate, EventUpdate
+from backend.models.api import Event, EventCreate, EventUpdate, event_to_api
 from backend.services.event_service import EventService
 from backend.dependencies import get_event_service
-from backend.exceptions import ResourceNotFoundError, RepositoryError
+from backend.utils import encode_page_token, decode_page_token
 
 
 router = APIRouter(prefix="/events", tags=["events"])
@@ -18,64 +19,71 @@ def create_event(
     event_service: EventService = Depends(get_event_service)
 ):
     """Create a new event."""
+    event_data = event.model_dump(mode='json')
     try:
-        event_data = event.model_dump()
-        domain_event = event_service.create_event(event_data)
-        
-        # Convert domain model to API model
-        return Event(
-            eventId=domain_event.event_id,
-            title=domain_event.title,
-            description=domain_event.description,
-            date=domain_event.date,
-            location=domain_event.location,
-            capacity=domain_event.capacity,
-            organizer=domain_event.organizer,
-            status=domain_event.status,
-            currentRegistrations=domain_event.current_registrations,
-            waitlistEnabled=domain_event.waitlist_enabled,
-            createdAt=domain_event.created_at,
-            updatedAt=domain_event.updated_at
-        )
-    except RepositoryError as e:
+        return event_to_api(event_service.create_event(event_data))
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
 
 
 @router.get("", response_model=List[Event])
 def list_events(
+    response: Response,
     status_filter: Optional[str] = Query(None, alias="status"),
+    limit: Optional[int] = Query(None, gt=0, le=1000),
+    next_token: Optional[str] = Query(None),
     event_service: EventService = Depends(get_event_service)
 ):
-    """List all events, optionally filtered by status."""
+    """List all events, optionally filtered by status.
+
+    When `limit` is provided a single page is returned and the token for
+    the next page (if any) is exposed in the `X-Next-Token` header.
+    """
+    if limit is None and next_token is None:
+        # Items come back already in the response shape (see EventDict)
+        # and pre-serialized, with repeat hits served straight from the
+        # repository's payload cache; sending the bytes as-is skips the
+        # pydantic re-validation pass and the per-request serialization.
+        return Response(
+            content=event_service.list_events_json(status_filter),
+            media_type="application/json"
+        )
+
     try:
-        domain_events = event_service.list_events(status_filter)
-        
-        # Convert domain models to API models
-        return [
-            Event(
-                eventId=e.event_id,
-                title=e.title,
-                description=e.description,
-                date=e.date,
-                location=e.location,
-                capacity=e.capacity,
-                organizer=e.organizer,
-                status=e.status,
-                currentRegistrations=e.current_registrations,
-                waitlistEnabled=e.waitlist_enabled,
-                createdAt=e.created_at,
-                updatedAt=e.updated_at
-            )
-            for e in domain_events
-        ]
-    except RepositoryError as e:
+        start_key = decode_page_token(next_token)
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    domain_events, last_key = event_service.list_events_page(
+        status_filter, limit or 100, start_key
+    )
+    token = encode_page_token(last_key)
+    if token:
+        response.headers["X-Next-Token"] = token
+
+    return [event_to_api(e) for e in domain_events]
+
+
+@router.get("/stream")
+def stream_events(
+    status_filter: Optional[str] = Query(None, alias="status"),
+    event_service: EventService = Depends(get_event_service)
+):
+    """Stream all events as newline-delimited JSON.
+
+    Pages are fetched lazily, so memory stays constant regardless of how
+    many events exist.
+    """
+    def generate():
+        for e in event_service.iter_events(status_filter):
+            yield event_to_api(e).model_dump_json() + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/{event_id}", response_model=Event)
@@ -84,34 +92,7 @@ def get_event(
     event_service: EventService = Depends(get_event_service)
 ):
     """Get an event by ID."""
-    try:
-        domain_event = event_service.get_event(event_id)
-        
-        # Convert domain model to API model
-        return Event(
-            eventId=domain_event.event_id,
-            title=domain_event.title,
-            description=domain_event.description,
-            date=domain_event.date,
-            location=domain_event.location,
-            capacity=domain_event.capacity,
-            organizer=domain_event.organizer,
-            status=domain_event.status,
-            currentRegistrations=domain_event.current_registrations,
-            waitlistEnabled=domain_event.waitlist_enabled,
-            createdAt=domain_event.created_at,
-            updatedAt=domain_event.updated_at
-        )
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except RepositoryError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return event_to_api(event_service.get_event(event_id))
 
 
 @router.put("/{event_id}", response_model=Event)
@@ -121,47 +102,23 @@ def update_event(
     event_service: EventService = Depends(get_event_service)
 ):
     """Update an event."""
-    try:
-        update_data = event_update.model_dump(exclude_unset=True)
-        
-        if not update_data:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No fields to update"
-            )
-        
-        domain_event = event_service.update_event(event_id, update_data)
-        
-        # Convert domain model to API model
-        return Event(
-            eventId=domain_event.event_id,
-            title=domain_event.title,
-            description=domain_event.description,
-            date=domain_event.date,
-            location=domain_event.location,
-            capacity=domain_event.capacity,
-            organizer=domain_event.organizer,
-            status=domain_event.status,
-            currentRegistrations=domain_event.current_registrations,
-            waitlistEnabled=domain_event.waitlist_enabled,
-            createdAt=domain_event.created_at,
-            updatedAt=domain_event.updated_at
-        )
-    except ResourceNotFoundError as e:
+    update_data = event_update.model_dump(mode='json', exclude_unset=True)
+
+    if not update_data:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No fields to update"
         )
+
+    try:
+        domain_event = event_service.update_event(event_id, update_data)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except RepositoryError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+
+    return event_to_api(domain_event)
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -170,16 +127,5 @@ def delete_event(
     event_service: EventService = Depends(get_event_service)
 ):
     """Delete an event."""
-    try:
-        event_service.delete_event(event_id)
-        return None
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except RepositoryError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    event_service.delete_event(event_id)
+    return None
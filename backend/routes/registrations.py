@@ -1,18 +1,21 @@
 """Registration API routes."""
 
 from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
 
-from backend.models.api import Registration, RegistrationRequest, EventRegistrationRequest, Event
-from backend.services.registration_service import RegistrationService
-from backend.services.event_service import EventService
-from backend.dependencies import get_registration_service, get_event_service
-from backend.exceptions import (
-    ResourceNotFoundError,
-    ResourceAlreadyExistsError,
-    CapacityExceededError,
-    RepositoryError
+import orjson
+from fastapi import APIRouter, status, Depends, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from backend.models.api import (
+    Registration,
+    RegistrationRequest,
+    EventRegistrationRequest,
+    Event,
+    event_to_api,
+    registration_to_api
 )
+from backend.services.registration_service import RegistrationService
+from backend.dependencies import get_registration_service
 
 
 router = APIRouter(tags=["registrations"])
@@ -24,39 +27,11 @@ def register_user_for_event(
     registration_service: RegistrationService = Depends(get_registration_service)
 ):
     """Register a user for an event."""
-    try:
-        domain_registration = registration_service.register_user(
-            registration.userId,
-            registration.eventId
-        )
-        
-        # Convert domain model to API model
-        return Registration(
-            userId=domain_registration.user_id,
-            eventId=domain_registration.event_id,
-            registrationStatus=domain_registration.registration_status,
-            registeredAt=domain_registration.registered_at
-        )
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except ResourceAlreadyExistsError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-    except CapacityExceededError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-    except RepositoryError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    domain_registration = registration_service.register_user(
+        registration.userId,
+        registration.eventId
+    )
+    return registration_to_api(domain_registration)
 
 
 @router.delete("/registrations/{user_id}/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -66,19 +41,8 @@ def unregister_user_from_event(
     registration_service: RegistrationService = Depends(get_registration_service)
 ):
     """Unregister a user from an event."""
-    try:
-        registration_service.unregister_user(user_id, event_id)
-        return None
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except RepositoryError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    registration_service.unregister_user(user_id, event_id)
+    return None
 
 
 @router.get("/users/{user_id}/events", response_model=List[Event])
@@ -87,32 +51,8 @@ def get_user_events(
     registration_service: RegistrationService = Depends(get_registration_service)
 ):
     """Get all events a user is registered for."""
-    try:
-        domain_events = registration_service.get_user_events(user_id)
-        
-        # Convert domain models to API models
-        return [
-            Event(
-                eventId=e.event_id,
-                title=e.title,
-                description=e.description,
-                date=e.date,
-                location=e.location,
-                capacity=e.capacity,
-                organizer=e.organizer,
-                status=e.status,
-                currentRegistrations=e.current_registrations,
-                waitlistEnabled=e.waitlist_enabled,
-                createdAt=e.created_at,
-                updatedAt=e.updated_at
-            )
-            for e in domain_events
-        ]
-    except RepositoryError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    domain_events = registration_service.get_user_events(user_id)
+    return [event_to_api(e) for e in domain_events]
 
 
 @router.post("/events/{event_id}/registrations", response_model=Registration, status_code=status.HTTP_201_CREATED)
@@ -122,65 +62,50 @@ def register_user_for_event_alt(
     registration_service: RegistrationService = Depends(get_registration_service)
 ):
     """Alternative endpoint: POST /events/{event_id}/registrations"""
-    try:
-        domain_registration = registration_service.register_user(
-            reg_request.userId,
-            event_id
-        )
-        
-        # Convert domain model to API model
-        return Registration(
-            userId=domain_registration.user_id,
-            eventId=domain_registration.event_id,
-            registrationStatus=domain_registration.registration_status,
-            registeredAt=domain_registration.registered_at
-        )
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except ResourceAlreadyExistsError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-    except CapacityExceededError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-    except RepositoryError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    domain_registration = registration_service.register_user(
+        reg_request.userId,
+        event_id
+    )
+    return registration_to_api(domain_registration)
 
 
 @router.get("/events/{event_id}/registrations", response_model=List[Registration])
 def get_event_registrations(
     event_id: str,
+    stream: bool = Query(False),
+    columnar: bool = Query(False),
     registration_service: RegistrationService = Depends(get_registration_service)
 ):
-    """Get all registrations for an event."""
-    try:
-        domain_registrations = registration_service.get_event_registrations(event_id)
-        
-        # Convert domain models to API models
-        return [
-            Registration(
-                userId=r.user_id,
-                eventId=r.event_id,
-                registrationStatus=r.registration_status,
-                registeredAt=r.registered_at
-            )
-            for r in domain_registrations
-        ]
-    except RepositoryError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    """Get all registrations for an event.
+
+    With `stream=true` the same JSON array is emitted incrementally as
+    DynamoDB pages arrive, keeping peak memory constant for events with
+    very large registration lists. With `columnar=true` the response is
+    a column-oriented `{"items": {attr: [values...]}}` payload that skips
+    per-row model construction entirely — the cheapest shape for bulk
+    consumers like dashboards.
+    """
+    if columnar:
+        return ORJSONResponse(
+            {'items': registration_service.get_event_registrations_columnar(event_id)}
+        )
+
+    if stream:
+        def generate():
+            yield b'['
+            first = True
+            for item in registration_service.iter_event_registrations(event_id):
+                if first:
+                    first = False
+                else:
+                    yield b','
+                yield orjson.dumps(item)
+            yield b']'
+
+        return StreamingResponse(generate(), media_type="application/json")
+
+    domain_registrations = registration_service.get_event_registrations(event_id)
+    return [registration_to_api(r) for r in domain_registrations]
 
 
 @router.delete("/events/{event_id}/registrations/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -190,19 +115,8 @@ def unregister_user_from_event_alt(
     registration_service: RegistrationService = Depends(get_registration_service)
 ):
     """Alternative endpoint: DELETE /events/{event_id}/registrations/{user_id}"""
-    try:
-        registration_service.unregister_user(user_id, event_id)
-        return None
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except RepositoryError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    registration_service.unregister_user(user_id, event_id)
+    return None
 
 
 @router.get("/users/{user_id}/registrations", response_model=List[Registration])
@@ -211,21 +125,5 @@ def get_user_registrations(
     registration_service: RegistrationService = Depends(get_registration_service)
 ):
     """Get all registrations for a user."""
-    try:
-        domain_registrations = registration_service.get_user_registrations(user_id)
-        
-        # Convert domain models to API models
-        return [
-            Registration(
-                userId=r.user_id,
-                eventId=r.event_id,
-                registrationStatus=r.registration_status,
-                registeredAt=r.registered_at
-            )
-            for r in domain_registrations
-        ]
-    except RepositoryError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    domain_registrations = registration_service.get_user_registrations(user_id)
+    return [registration_to_api(r) for r in domain_registrations]
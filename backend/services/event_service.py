@@ -1,7 +1,8 @@
 """Event service for business logic."""
 
+import os
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
-import uuid
 
 from backend.repositories.event_repository import EventRepository
 from backend.models.domain import DomainEvent
@@ -9,6 +10,38 @@ from backend.exceptions import ResourceNotFoundError
 from backend.utils import get_timestamp
 
 
+def _fast_uuid4() -> str:
+    """Generate a random UUID-shaped event ID.
+
+    Same 122+ bits of os.urandom entropy and the same dashed text form as
+    str(uuid.uuid4()), minus the UUID object construction and field
+    parsing. Event IDs are opaque strings to every consumer, so the RFC
+    4122 version bits the class would set are not needed.
+    """
+    h = os.urandom(16).hex()
+    return f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
+
+
+# One C-level multi-get for the required create fields instead of seven
+# hashed lookups; a missing key surfaces as a single KeyError up front.
+_required_event_fields = itemgetter(
+    'title', 'description', 'date', 'location', 'capacity', 'organizer', 'status'
+)
+
+# Updatable camelCase attribute -> DomainEvent field, for the no-op check
+# in update_event. Only waitlistEnabled differs from its field name.
+_UPDATE_ATTR_FIELDS = {
+    'title': 'title',
+    'description': 'description',
+    'date': 'date',
+    'location': 'location',
+    'capacity': 'capacity',
+    'organizer': 'organizer',
+    'status': 'status',
+    'waitlistEnabled': 'waitlist_enabled',
+}
+
+
 class EventService:
     """Service for event business logic."""
     
@@ -28,25 +61,34 @@ class EventService:
             
         Returns:
             Created DomainEvent
+
+        Raises:
+            ValueError: If a required field is missing
         """
-        event_id = event_data.get('eventId') or str(uuid.uuid4())
+        event_id = event_data.get('eventId') or _fast_uuid4()
         timestamp = get_timestamp()
-        
+
+        try:
+            (title, description, date, location, capacity,
+             organizer, event_status) = _required_event_fields(event_data)
+        except KeyError as e:
+            raise ValueError(f"Missing required event field: {e.args[0]}")
+
         event = DomainEvent(
             event_id=event_id,
-            title=event_data['title'],
-            description=event_data['description'],
-            date=event_data['date'],
-            location=event_data['location'],
-            capacity=event_data['capacity'],
-            organizer=event_data['organizer'],
-            status=event_data['status'],
+            title=title,
+            description=description,
+            date=date,
+            location=location,
+            capacity=capacity,
+            organizer=organizer,
+            status=event_status,
             current_registrations=0,
             waitlist_enabled=event_data.get('waitlistEnabled', False),
             created_at=timestamp,
             updated_at=timestamp
         )
-        
+
         return self.event_repo.create(event)
     
     def get_event(self, event_id: str) -> DomainEvent:
@@ -61,6 +103,8 @@ class EventService:
         Raises:
             ResourceNotFoundError: If event not found
         """
+        # Hot reads are cached at the repository layer, where every caller
+        # (including the registration flow) shares the same entries.
         event = self.event_repo.get_by_id(event_id)
         if not event:
             raise ResourceNotFoundError(f"Event with ID {event_id} not found")
@@ -76,6 +120,57 @@ class EventService:
             List of DomainEvent objects
         """
         return self.event_repo.list_all(status_filter)
+
+    def list_events_raw(self, status_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List all events as response-shaped plain dicts.
+
+        Args:
+            status_filter: Optional status to filter by
+
+        Returns:
+            List of event items ready for JSON serialization
+        """
+        return self.event_repo.list_all_raw(status_filter)
+
+    def list_events_json(self, status_filter: Optional[str] = None) -> bytes:
+        """List all events as cached, pre-serialized JSON bytes.
+
+        Args:
+            status_filter: Optional status to filter by
+
+        Returns:
+            JSON array of event objects, UTF-8 bytes
+        """
+        return self.event_repo.list_all_json(status_filter)
+
+    def iter_events(self, status_filter: Optional[str] = None):
+        """Iterate all events lazily, page by page.
+
+        Args:
+            status_filter: Optional status to filter by
+
+        Yields:
+            DomainEvent objects
+        """
+        return self.event_repo.iter_all(status_filter)
+
+    def list_events_page(
+        self,
+        status_filter: Optional[str] = None,
+        limit: int = 100,
+        start_key: Optional[Dict[str, Any]] = None
+    ) -> tuple:
+        """List a single page of events.
+
+        Args:
+            status_filter: Optional status to filter by
+            limit: Maximum number of items to return
+            start_key: ExclusiveStartKey from a previous page, if any
+
+        Returns:
+            Tuple of (list of DomainEvent objects, LastEvaluatedKey or None)
+        """
+        return self.event_repo.list_page(status_filter, limit, start_key)
     
     def update_event(self, event_id: str, updates: Dict[str, Any]) -> DomainEvent:
         """Update an event.
@@ -92,10 +187,25 @@ class EventService:
         """
         if not updates:
             raise ValueError("No fields to update")
-        
+
+        # Skip the write only when a copy cached by THIS process already
+        # matches every field: such an entry postdates this container's
+        # last write (every write path invalidates), so a client that
+        # PATCHes the same object back costs no write and no updatedAt
+        # churn. Anything less certain — a cache miss, or any differing
+        # field — goes straight to the conditional update, which is
+        # authoritative, needs no pre-read, and raises
+        # ResourceNotFoundError itself when the event is gone.
+        cached = self.event_repo.get_cached(event_id)
+        if cached is not None and all(
+            getattr(cached, _UPDATE_ATTR_FIELDS.get(k, k), None) == v
+            for k, v in updates.items()
+        ):
+            return cached
+
         # Add updated timestamp
-        updates['updatedAt'] = get_timestamp()
-        
+        updates = {**updates, 'updatedAt': get_timestamp()}
+
         return self.event_repo.update(event_id, updates)
     
     def delete_event(self, event_id: str) -> None:
@@ -6,9 +6,13 @@ from backend.repositories.registration_repository import RegistrationRepository
 from backend.repositories.event_repository import EventRepository
 from backend.repositories.user_repository import UserRepository
 from backend.models.domain import DomainRegistration, DomainEvent
-from backend.exceptions import ResourceNotFoundError, ResourceAlreadyExistsError, CapacityExceededError
+from backend.exceptions import ResourceNotFoundError, CapacityExceededError, StaleWriteError
 from backend.utils import get_timestamp
 
+# Interned once so the status comparisons below resolve by pointer
+# equality before falling back to character comparison.
+_REGISTERED = 'registered'
+
 
 class RegistrationService:
     """Service for registration business logic."""
@@ -26,96 +30,127 @@ class RegistrationService:
     
     def register_user(self, user_id: str, event_id: str) -> DomainRegistration:
         """Register a user for an event."""
-        # Verify user exists
-        user = self.user_repo.get_by_id(user_id)
-        if not user:
-            raise ResourceNotFoundError(f"User with ID {user_id} not found")
-        
-        # Verify event exists and get details
-        event = self.event_repo.get_by_id(event_id)
-        if not event:
-            raise ResourceNotFoundError(f"Event with ID {event_id} not found")
-        
-        # Check if already registered
-        existing_reg = self.registration_repo.get_registration(user_id, event_id)
-        if existing_reg:
-            raise ResourceAlreadyExistsError("User is already registered for this event")
-        
         timestamp = get_timestamp()
-        registration_status = 'registered'
-        
-        # Check capacity
-        if event.current_registrations >= event.capacity:
-            if not event.waitlist_enabled:
-                raise CapacityExceededError("Event is at full capacity and waitlist is not enabled")
-            else:
-                registration_status = 'waitlisted'
-                self.registration_repo.add_to_waitlist(user_id, event_id, timestamp)
-        else:
-            self.event_repo.increment_registrations(event_id)
-        
-        # Create registration record
         registration = DomainRegistration(
             user_id=user_id,
             event_id=event_id,
-            registration_status=registration_status,
+            registration_status=_REGISTERED,
             registered_at=timestamp
         )
-        
-        return self.registration_repo.create_registration(registration)
+
+        # Happy path: one transaction checks the user profile, enforces
+        # capacity, increments the counter, and writes both registration
+        # rows atomically — no pre-reads.
+        try:
+            return self.registration_repo.register_with_capacity(registration)
+        except CapacityExceededError:
+            pass
+
+        # The capacity condition failed: the event is missing, or full.
+        if not self.user_repo.exists(user_id):
+            raise ResourceNotFoundError(f"User with ID {user_id} not found")
+        event = self.event_repo.get_by_id(event_id)
+        if not event:
+            raise ResourceNotFoundError(f"Event with ID {event_id} not found")
+        if not event.waitlist_enabled:
+            raise CapacityExceededError("Event is at full capacity and waitlist is not enabled")
+
+        registration.registration_status = 'waitlisted'
+        # One transaction writes the ordering entry and both lookup rows,
+        # so a waitlisted registration can never lack its queue position.
+        return self.registration_repo.register_waitlisted(registration, timestamp)
     
     def unregister_user(self, user_id: str, event_id: str) -> None:
         """Unregister a user from an event."""
-        registration = self.registration_repo.get_registration(user_id, event_id)
+        # The transaction is guarded on the status read below, so if a
+        # concurrent write (e.g. a promotion) flips it in between, the
+        # whole thing cancels with StaleWriteError instead of settling
+        # the seat the wrong way; re-read and settle under the new
+        # status, bounded so a pathological race cannot spin.
+        for _ in range(3):
+            try:
+                self._unregister_once(user_id, event_id)
+                return
+            except StaleWriteError:
+                continue
+        raise StaleWriteError(
+            "Registration was modified concurrently; re-read and retry"
+        )
+
+    def _unregister_once(self, user_id: str, event_id: str) -> None:
+        """One read-then-transact unregistration attempt."""
+        # One consistent read tells us whether a spot is being freed;
+        # every mutation then lands in a single transaction, so a crash
+        # can never leave the counter out of step with the rows.
+        registration = self.registration_repo.get_registration(
+            user_id, event_id, consistent=True
+        )
         if not registration:
             raise ResourceNotFoundError("Registration not found")
-        
-        if registration.registration_status == 'registered':
-            self.event_repo.decrement_registrations(event_id)
-            
+
+        if registration.registration_status != _REGISTERED:
+            # A waitlisted registration also has a WAITLIST# ordering
+            # entry, keyed on its registration timestamp; delete it in
+            # the same transaction or it would linger as a dead queue
+            # head that no promotion can ever consume.
+            self.registration_repo.unregister_transactionally(
+                user_id, event_id, waitlisted_at=registration.registered_at
+            )
+            return
+
+        # Promote the waitlist head into the freed spot in the same
+        # transaction as the delete. The head is consumed conditionally,
+        # so a concurrent unregister can steal it — re-read and try the
+        # next head, bounded so a pathological race cannot spin.
+        for _ in range(3):
             waitlist_entry = self.registration_repo.get_first_waitlisted(event_id)
-            
-            if waitlist_entry:
-                waitlisted_user_id = waitlist_entry['userId']
-                
-                self.registration_repo.update_registration_status(
-                    waitlisted_user_id,
-                    event_id,
-                    'registered'
-                )
-                
-                self.registration_repo.remove_from_waitlist(
-                    waitlist_entry['PK'],
-                    waitlist_entry['SK']
+            if not waitlist_entry:
+                self.registration_repo.unregister_transactionally(
+                    user_id, event_id, free_spot=True
                 )
-                
-                self.event_repo.increment_registrations(event_id)
-        
-        self.registration_repo.delete_registration(user_id, event_id)
+                return
+            if self.registration_repo.unregister_transactionally(
+                user_id, event_id, waitlist_entry=waitlist_entry
+            ):
+                return
+        # Every retry lost its race, meaning other promoters filled the
+        # spot each time; give the freed spot back to capacity.
+        self.registration_repo.unregister_transactionally(
+            user_id, event_id, free_spot=True
+        )
     
     def get_user_events(self, user_id: str) -> List[DomainEvent]:
         """Get all events a user is registered for."""
-        registrations = self.registration_repo.list_user_registrations(user_id)
-        
-        registered_event_ids = [
+        # The status filter runs server-side, so waitlisted rows never
+        # reach this process.
+        registrations = self.registration_repo.list_user_registrations(
+            user_id, status=_REGISTERED
+        )
+
+        # Dedupe defensively (duplicate rows would double-fetch the same
+        # event) while keeping registration order for the batch get.
+        registered_event_ids = list(dict.fromkeys(
             reg.event_id for reg in registrations
-            if reg.registration_status == 'registered'
-        ]
-        
+        ))
+
         if not registered_event_ids:
             return []
-        
-        events = []
-        for event_id in registered_event_ids:
-            event = self.event_repo.get_by_id(event_id)
-            if event:
-                events.append(event)
-        
-        return events
+
+        # One BatchGetItem round trip per 100 events instead of a GetItem
+        # per event.
+        return self.event_repo.get_by_ids(registered_event_ids)
     
     def get_event_registrations(self, event_id: str) -> List[DomainRegistration]:
         """Get all registrations for an event."""
         return self.registration_repo.list_event_registrations(event_id)
+
+    def iter_event_registrations(self, event_id: str):
+        """Iterate raw registration items for an event, page by page."""
+        return self.registration_repo.iter_event_registrations(event_id)
+
+    def get_event_registrations_columnar(self, event_id: str):
+        """Get an event's registrations as a column-oriented dict."""
+        return self.registration_repo.list_event_registrations_columnar(event_id)
     
     def get_user_registrations(self, user_id: str) -> List[DomainRegistration]:
         """Get all registrations for a user."""
@@ -53,6 +53,7 @@ class UserService:
         Raises:
             ResourceNotFoundError: If user not found
         """
+        # Caching lives in the repository, so every caller shares it.
         user = self.user_repo.get_by_id(user_id)
         if not user:
             raise ResourceNotFoundError(f"User with ID {user_id} not found")
@@ -1,8 +1,41 @@
 """Shared utility functions."""
 
-from datetime import datetime
+import base64
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import orjson
+
+
+# Bound once at import so each call skips the module-attribute lookups;
+# this runs on every create/update across all three services.
+_UTC = timezone.utc
+_now = datetime.now
 
 
 def get_timestamp() -> str:
     """Generate ISO format timestamp."""
-    return datetime.utcnow().isoformat()
+    return _now(_UTC).isoformat(timespec='milliseconds')
+
+
+def encode_page_token(last_evaluated_key: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Encode a DynamoDB LastEvaluatedKey as an opaque pagination token."""
+    if not last_evaluated_key:
+        return None
+    return base64.urlsafe_b64encode(orjson.dumps(last_evaluated_key)).decode()
+
+
+def decode_page_token(token: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode a pagination token back into a DynamoDB ExclusiveStartKey.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    if not token:
+        return None
+    try:
+        return orjson.loads(base64.urlsafe_b64decode(token.encode()))
+    except ValueError:
+        # orjson.JSONDecodeError subclasses ValueError, as does the
+        # base64 padding error.
+        raise ValueError("Invalid pagination token")